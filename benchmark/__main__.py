@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import sys
+import json
+import time
+import platform
+import argparse
+
+from benchmark.suite import CASES
+
+#
+# Benchmark runner: runs the suite, writes the results as JSON and compares them with a baseline
+#
+# Usage: python -m benchmark [--output FILE] [--baseline FILE] [--threshold RATIO] [NAME ...]
+#
+# The best time of each case is compared, a case slower than the baseline by more than the threshold
+# (0.10 = 10 %) is reported as a regression and makes the runner exit with 1.
+#
+
+def measure(setup, arguments, repeat):
+	callback = setup(*arguments)
+	timings = []
+
+	for i in range(0, repeat):
+		start = time.perf_counter()
+		callback()
+		timings.append(time.perf_counter() - start)
+
+	timings.sort()
+
+	return {'best': timings[0], 'median': timings[len(timings) // 2], 'repeat': repeat}
+
+def run(names):
+	results = {}
+
+	for name, setup, arguments, repeat in CASES:
+		if names and not any(name.startswith(prefix) for prefix in names):
+			continue
+
+		results[name] = measure(setup, arguments, repeat)
+		print('{:<32} : {:10.3f} ms best, {:10.3f} ms median'.format(name, results[name]['best'] * 1000, results[name]['median'] * 1000))
+
+	return results
+
+def compare(results, baseline, threshold):
+	regressions = 0
+
+	for name, result in results.items():
+		if name not in baseline:
+			continue
+
+		ratio = result['best'] / baseline[name]['best'] if baseline[name]['best'] else 1
+		regressed = ratio > 1 + threshold
+		regressions += regressed
+
+		print('{:<32} : {:10.3f} ms -> {:10.3f} ms ({:+6.1f} %){}'.format(name, baseline[name]['best'] * 1000, result['best'] * 1000, (ratio - 1) * 100, '  REGRESSION' if regressed else ''))
+
+	return regressions
+
+def main(argv):
+	parser = argparse.ArgumentParser(prog='python -m benchmark')
+	parser.add_argument('names', nargs='*', help='only run the cases starting with these names')
+	parser.add_argument('--output', help='write the results as JSON to this file')
+	parser.add_argument('--baseline', help='compare the results with this results file')
+	parser.add_argument('--threshold', type=float, default=0.10, help='slowdown ratio reported as a regression')
+	options = parser.parse_args(argv)
+
+	results = run(options.names)
+
+	if options.output:
+		with open(options.output, 'w', encoding='utf-8') as handle:
+			json.dump({'python': platform.python_version(), 'platform': platform.platform(), 'time': time.time(), 'results': results}, handle, indent=4)
+
+	if options.baseline:
+		with open(options.baseline, 'r', encoding='utf-8') as handle:
+			baseline = json.load(handle)['results']
+
+		print()
+
+		if compare(results, baseline, options.threshold):
+			return 1
+
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import sys
+import time
+
+from console.input.ArgvInput import ArgvInput
+from benchmark.definition import buildDefinition
+
+#
+# ArgvInput benchmark: bind/parse of huge command lines, which must stay linear in the number of tokens
+#
+# Usage: python -m benchmark.argv [tokens ...]
+#
+
+GLOBAL_FLAGS = [['--no-interaction', '-n'], ['--verbose', '-v'], ['--version', '-V'], ['--help', '-h']]
+
+def buildTokens(count):
+	tokens = ['command', 'target']
+
+	for i in range(0, count):
+		if i % 10 == 0:
+			tokens.append('-x{}'.format(i))
+		else:
+			tokens.append('name{}'.format(i))
+
+	return tokens
+
+def measure(count):
+	tokens = buildTokens(count)
+	definition = buildDefinition()
+
+	start = time.perf_counter()
+	input = ArgvInput(tokens)
+
+	for values in GLOBAL_FLAGS:
+		input.hasParameterOption(values)
+
+	input.bind(definition)
+
+	return time.perf_counter() - start
+
+def main(argv):
+	counts = [int(arg) for arg in argv] if argv else [10000, 100000, 1000000]
+
+	for count in counts:
+		elapsed = measure(count)
+		print('{:>8} tokens : {:9.2f} ms ({:6.0f} ns/token)'.format(count, elapsed * 1000, elapsed * 1e9 / count))
+
+if __name__ == '__main__':
+	main(sys.argv[1:])
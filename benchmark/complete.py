@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import sys
+import time
+import subprocess
+
+#
+# Completion benchmark: times `main.py _complete` as the shell runs it and checks what it imports
+#
+# Usage: python -m benchmark.complete [LINE ...]
+#
+# Exits with 1 when the best run is over the latency budget or when a forbidden module is imported.
+#
+
+REPEAT = 10
+
+BUDGET = 0.020
+
+FORBIDDEN = ['prompt_toolkit', 'colorama', 'console.Command', 'console.Application', 'console.ConsoleApplication']
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MAIN = os.path.join(ROOT, 'main.py')
+
+def complete(line):
+	return subprocess.run([sys.executable, MAIN, '_complete', line], stdout=subprocess.PIPE, check=True).stdout.decode()
+
+def measure(callback, *args):
+	best = None
+
+	for i in range(0, REPEAT):
+		start = time.perf_counter()
+		callback(*args)
+		elapsed = time.perf_counter() - start
+
+		if best is None or elapsed < best:
+			best = elapsed
+
+	return best
+
+def getImportedModules(line):
+	code = 'import sys, runpy; sys.argv = [{!r}, "_complete", {!r}]\n' \
+		'try:\n\trunpy.run_path({!r}, run_name="__main__")\n' \
+		'except SystemExit:\n\tpass\n' \
+		'sys.stderr.write("\\n".join(sys.modules))'.format(MAIN, line, MAIN)
+	result = subprocess.run([sys.executable, '-c', code], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+
+	return result.stderr.decode().split('\n')
+
+def main(argv):
+	lines = argv or ['main.py ', 'main.py module:generate --']
+	baseline = measure(subprocess.run, [sys.executable, '-c', 'pass'])
+	failed = False
+
+	# The first call refreshes the command manifest when it is missing or stale
+	complete(lines[0])
+
+	for line in lines:
+		elapsed = measure(complete, line)
+		forbidden = [module for module in getImportedModules(line) if module.split('.')[0] in FORBIDDEN or module in FORBIDDEN]
+		failed = failed or elapsed > BUDGET + baseline or bool(forbidden)
+
+		print('{!r:>40} : {:8.3f} ms ({:8.3f} ms over the interpreter startup)'.format(line, elapsed * 1000, (elapsed - baseline) * 1000))
+
+		if forbidden:
+			print('{:>40}   imports {}'.format('', ', '.join(sorted(forbidden))))
+
+	return 1 if failed else 0
+
+if __name__ == '__main__':
+	sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import sys
+import time
+import tempfile
+import subprocess
+
+#
+# Daemon benchmark: compares a cold `main.py` dispatch with a `client.py` dispatch served by a warm daemon
+#
+# Usage: python -m benchmark.daemon [command ...]
+#
+
+REPEAT = 20
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def measure(argv, env):
+	timings = []
+
+	for i in range(0, REPEAT):
+		start = time.perf_counter()
+		subprocess.run([sys.executable] + argv, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+		timings.append(time.perf_counter() - start)
+
+	timings.sort()
+
+	return timings[len(timings) // 2]
+
+def main(argv):
+	command = argv or ['list']
+	env = dict(os.environ)
+	env['ALICECONSOLE_SOCKET'] = os.path.join(tempfile.mkdtemp(), 'benchmark.sock')
+
+	cold = measure([os.path.join(ROOT, 'main.py')] + command, env)
+
+	daemon = subprocess.Popen([sys.executable, os.path.join(ROOT, 'main.py'), '--daemon'], env=env, stdout=subprocess.DEVNULL)
+
+	try:
+		while not os.path.exists(env['ALICECONSOLE_SOCKET']):
+			time.sleep(0.01)
+
+		warm = measure([os.path.join(ROOT, 'client.py')] + command, env)
+	finally:
+		daemon.terminate()
+		daemon.wait()
+
+	print('cold main.py {:<20}: {:8.2f} ms'.format(' '.join(command), cold * 1000))
+	print('warm client.py {:<18}: {:8.2f} ms'.format(' '.join(command), warm * 1000))
+
+if __name__ == '__main__':
+	main(sys.argv[1:])
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import sys
+import time
+
+from console.input.ArgvInput import ArgvInput
+from console.input.InputArgument import InputArgument
+from console.input.InputDefinition import InputDefinition
+from console.input.InputOption import InputOption
+
+#
+# InputDefinition benchmark: positional lookups done by ArgvInput.parseArgument and option lookups by shortcut
+#
+# Usage: python -m benchmark.definition [tokens]
+#
+
+def buildDefinition():
+	return InputDefinition([
+		InputArgument(name='command', mode=InputArgument.REQUIRED, description='The command to execute'),
+		InputArgument(name='target', mode=InputArgument.REQUIRED, description='Target'),
+		InputArgument(name='names', mode=InputArgument.ARRAY, description='Names'),
+		InputOption(name='--verbose', shortcut='-v', mode=InputOption.VALUE_NONE, description='Verbose'),
+		InputOption(name='--value', shortcut='-x', mode=InputOption.VALUE_REQUIRED, description='Value')
+	])
+
+def measurePositional(count):
+	definition = buildDefinition()
+	tokens = ['name{}'.format(i) for i in range(0, count)]
+	input = ArgvInput(['command'], standalone=True)
+	input.definition = definition
+	input.arguments = {}
+
+	start = time.perf_counter()
+
+	for token in tokens:
+		input.parseArgument(token)
+
+	return time.perf_counter() - start
+
+def measureShortcuts(count):
+	definition = buildDefinition()
+	start = time.perf_counter()
+
+	for i in range(0, count):
+		definition.getOptionForShortcut('x').acceptValue()
+
+	return time.perf_counter() - start
+
+def main(argv):
+	count = int(argv[0]) if argv else 100000
+
+	print('parseArgument x {} positional tokens : {:8.2f} ms'.format(count, measurePositional(count) * 1000))
+	print('getOptionForShortcut x {}            : {:8.2f} ms'.format(count, measureShortcuts(count) * 1000))
+
+if __name__ == '__main__':
+	main(sys.argv[1:])
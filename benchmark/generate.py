@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+from console.generator.ModuleArchive import ModuleArchive
+from console.generator.ModuleGenerator import ModuleGenerator
+
+#
+# Generation benchmark: renders and atomically writes N module skeletons, then generates them again unchanged
+# and packs them into a tar.gz archive
+#
+# Usage: python -m benchmark.generate [N ...]
+#
+
+LANGUAGES = ['en', 'fr', 'de']
+
+def generateAll(generator, count, destination):
+	for i in range(0, count):
+		context = ModuleGenerator.buildContext('Benchmark module {}'.format(i), 'jr-k', 'Benchmark module number {}'.format(i), LANGUAGES)
+		generator.generate(context, LANGUAGES, os.path.join(destination, context['moduleName']))
+
+def packAll(generator, count, path):
+	archive = ModuleArchive(path)
+
+	for i in range(0, count):
+		context = ModuleGenerator.buildContext('Benchmark module {}'.format(i), 'jr-k', 'Benchmark module number {}'.format(i), LANGUAGES)
+		archive.addModule(context['moduleName'], generator.render(context, LANGUAGES))
+
+	return archive.close()
+
+def measure(count):
+	generator = ModuleGenerator()
+	destination = tempfile.mkdtemp(prefix='aliceconsole-benchmark-')
+
+	try:
+		start = time.perf_counter()
+		generateAll(generator, count, destination)
+		generated = time.perf_counter() - start
+
+		start = time.perf_counter()
+		generateAll(generator, count, destination)
+		regenerated = time.perf_counter() - start
+
+		start = time.perf_counter()
+		packAll(generator, count, os.path.join(destination, 'modules.tar.gz'))
+
+		return generated, regenerated, time.perf_counter() - start
+	finally:
+		shutil.rmtree(destination, ignore_errors=True)
+
+def main(argv):
+	counts = [int(arg) for arg in argv] if argv else [1000]
+
+	for count in counts:
+		generated, regenerated, packed = measure(count)
+		print('{:>6} modules : {:9.2f} ms ({:6.3f} ms/module)'.format(count, generated * 1000, generated * 1000 / count))
+		print('{:>6} unchanged : {:7.2f} ms ({:6.3f} ms/module)'.format(count, regenerated * 1000, regenerated * 1000 / count))
+		print('{:>6} archived : {:8.2f} ms ({:6.3f} ms/module)'.format(count, packed * 1000, packed * 1000 / count))
+
+if __name__ == '__main__':
+	main(sys.argv[1:])
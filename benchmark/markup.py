@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import re
+import sys
+import time
+
+from console.Markup import colorize, stripMarkup, foreground, background
+
+#
+# Markup benchmark: compiled and stripped markup against the former findall/replace implementation
+#
+# Usage: python -m benchmark.markup [calls]
+#
+
+TEMPLATES = [
+	'<fg:yellow> - The command %command.name% generates an empty module<fg:reset>',
+	'Dummy type <fg:reset>[en]<fg:yellow>: ',
+	'<bg:blue><fg:white>Header<fg:reset><bg:reset> plain text',
+	'A line without any markup at all'
+]
+
+LEGACY_REGEX_COLOR = re.compile(r'<(fg|bg):([a-z]+)>')
+
+def legacyStringToColored(string, fgColor = 'reset', bgColor = 'reset'):
+	fgColor = foreground(fgColor)
+	bgColor = background(bgColor)
+
+	for (type, color) in LEGACY_REGEX_COLOR.findall(string):
+		string = string.replace('<{}:{}>'.format(type, color), background(color) if type == 'bg' else foreground(color))
+
+	return bgColor + fgColor + string + foreground('reset') + background('reset')
+
+def measure(function, calls):
+	start = time.perf_counter()
+
+	for i in range(0, calls):
+		function(TEMPLATES[i % len(TEMPLATES)], 'yellow')
+
+	return time.perf_counter() - start
+
+def main(argv):
+	calls = int(argv[0]) if argv else 200000
+
+	for name, function in [('legacy', legacyStringToColored), ('compiled', colorize), ('no-color', lambda string, color: stripMarkup(string))]:
+		elapsed = measure(function, calls)
+		print('{:<9} x {} : {:8.2f} ms ({:5.0f} ns/call)'.format(name, calls, elapsed * 1000, elapsed * 1e9 / calls))
+
+if __name__ == '__main__':
+	main(sys.argv[1:])
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import sys
+import tracemalloc
+
+from console.Application import Application
+from console.Command import Command
+from console.input.InputArgument import InputArgument
+from console.input.InputOption import InputOption
+
+#
+# Memory benchmark: traced allocations per registered (built and merged) command
+#
+# Usage: python -m benchmark.memory [commands]
+#
+
+class BenchmarkCommand(Command):
+
+	def __init__(self, index):
+		self.index = index
+		super(BenchmarkCommand, self).__init__()
+
+	def create(self):
+		self.setName('bench:command{}'.format(self.index))
+		self.setDescription('Benchmark command')
+		self.setDefinition([
+			InputArgument(name='target', mode=InputArgument.OPTIONAL, description='Target'),
+			InputOption(name='--force', shortcut='-f', mode=InputOption.VALUE_NONE, description='Force'),
+			InputOption(name='--output', shortcut='-o', mode=InputOption.VALUE_REQUIRED, description='Output')
+		])
+
+	def execute(self, input):
+		return 0
+
+def measure(count):
+	application = Application()
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+
+	for i in range(0, count):
+		command = application.add(BenchmarkCommand(i))
+		command.mergeApplicationDefinition()
+		command.getArrayChars()
+
+	after = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+
+	return after - before
+
+def main(argv):
+	count = int(argv[0]) if argv else 10000
+	size = measure(count)
+
+	print('{} commands : {:8.1f} KiB total, {:6.0f} bytes per command'.format(count, size / 1024, size / count))
+
+if __name__ == '__main__':
+	main(sys.argv[1:])
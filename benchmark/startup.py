@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import sys
+import time
+
+from console.Application import Application
+
+#
+# Startup benchmark: builds the Application with N lazily registered commands and resolves one of them
+#
+# Usage: python -m benchmark.startup [N ...]
+#
+
+REPEAT = 20
+
+def buildAndDispatch(entries):
+	application = Application()
+	application.registerCommands()
+
+	for name, factory in entries:
+		application.register(name, factory)
+
+	return application.find('module:generate')
+
+def measure(count):
+	entries = [('bench:command{}'.format(i), 'benchmark.missing.Command{}'.format(i)) for i in range(0, count)]
+	best = None
+
+	for i in range(0, REPEAT):
+		start = time.perf_counter()
+		buildAndDispatch(entries)
+		elapsed = time.perf_counter() - start
+
+		if best is None or elapsed < best:
+			best = elapsed
+
+	return best
+
+def main(argv):
+	counts = [int(arg) for arg in argv] if argv else [10, 1000]
+
+	for count in counts:
+		print('{:>6} registered commands : {:8.3f} ms'.format(count, measure(count) * 1000))
+
+if __name__ == '__main__':
+	main(sys.argv[1:])
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import io
+import os
+import sys
+import marshal
+import atexit
+import shutil
+import tempfile
+import subprocess
+
+from console.Application import Application
+from console.CommandMatcher import CommandMatcher
+from console.Output import Output
+from console.Tools import camelCase
+from console.command.ListCommand import ListCommand
+from console.input.ArgvInput import ArgvInput
+from console.input.InputDefinition import InputDefinition
+from console.input.InputOption import InputOption
+from console.loader.CommandManifest import CommandManifest
+from console.generator.ModuleGenerator import ModuleGenerator
+from benchmark.argv import buildTokens
+from benchmark.definition import buildDefinition
+from benchmark.generate import generateAll, packAll
+from benchmark.markup import TEMPLATES
+from benchmark.memory import BenchmarkCommand
+
+#
+# Benchmark suite: every case is set up by a function returning the callable to time
+#
+# Cases are run by python -m benchmark, see benchmark/__main__.py.
+#
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CAMEL_CASE_WORDS = ['module-generate', 'my_module.name', 'path/to/some-file_name', 'alreadyCamel', 'a-b-c-d-e-f']
+
+def setupImport():
+	return lambda: subprocess.run([sys.executable, '-c', 'import console.Application'], cwd=ROOT, check=True)
+
+def setupStartup():
+	return lambda: subprocess.run([sys.executable, os.path.join(ROOT, 'main.py'), '--version'], cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+
+def setupConstruct():
+	return Application
+
+def setupBind(count):
+	tokens = buildTokens(count)
+
+	def bind():
+		ArgvInput(tokens).bind(buildDefinition())
+
+	return bind
+
+def setupDefinition(count):
+	names = ['--option{}'.format(i) for i in range(0, count)]
+
+	def build():
+		InputDefinition([InputOption(name=name, shortcut=None, mode=InputOption.VALUE_REQUIRED, description='Option') for name in names])
+
+	return build
+
+def setupStringToColored(decorated):
+	command = ListCommand()
+	command.setOutput(Output(io.StringIO()).setDecorated(decorated))
+
+	def colorAll():
+		for i in range(0, 10000):
+			command.stringToColored(TEMPLATES[i % len(TEMPLATES)], 'yellow')
+
+	return colorAll
+
+def setupListCommand(count):
+	application = Application()
+	application.setAutoExit(False)
+	application.setCommandManifest(CommandManifest(None))
+
+	for i in range(0, count):
+		application.add(BenchmarkCommand(i))
+
+	command = application.find('list')
+
+	def render():
+		command.setOutput(Output(io.StringIO()))
+		command.execute(None)
+
+	return render
+
+def setupCamelCase():
+	def convert():
+		for i in range(0, 10000):
+			camelCase(CAMEL_CASE_WORDS[i % len(CAMEL_CASE_WORDS)], i % 2 == 0)
+
+	return convert
+
+def setupGenerate(count):
+	generator = ModuleGenerator()
+
+	def generate():
+		destination = tempfile.mkdtemp(prefix='aliceconsole-benchmark-')
+
+		try:
+			generateAll(generator, count, destination)
+		finally:
+			shutil.rmtree(destination, ignore_errors=True)
+
+	return generate
+
+def setupRegenerate(count):
+	generator = ModuleGenerator()
+	destination = tempfile.mkdtemp(prefix='aliceconsole-benchmark-')
+	atexit.register(shutil.rmtree, destination, True)
+	generateAll(generator, count, destination)
+
+	def regenerate():
+		generateAll(generator, count, destination)
+
+	return regenerate
+
+def setupArchive(count):
+	generator = ModuleGenerator()
+
+	def pack():
+		destination = tempfile.mkdtemp(prefix='aliceconsole-benchmark-')
+
+		try:
+			packAll(generator, count, os.path.join(destination, 'modules.tar.gz'))
+		finally:
+			shutil.rmtree(destination, ignore_errors=True)
+
+	return pack
+
+def setupSuggest(count):
+	matcher = CommandMatcher()
+
+	for i in range(0, count):
+		matcher.add('namespace{}:command{}'.format(i % 100, i))
+
+	index = marshal.dumps(matcher.getIndex())
+
+	def suggest():
+		# A failed lookup loads the index from the manifest first
+		CommandMatcher(marshal.loads(index)).match('namespace4:comand42')
+
+	return suggest
+
+# (name, setup, arguments, repeat)
+CASES = [
+	('startup.import', setupImport, (), 10),
+	('startup.main', setupStartup, (), 10),
+	('application.construct', setupConstruct, (), 200),
+	('argv.bind.small', setupBind, (10,), 1000),
+	('argv.bind.huge', setupBind, (100000,), 10),
+	('definition.build.1000', setupDefinition, (1000,), 20),
+	('command.stringToColored.color', setupStringToColored, (True,), 20),
+	('command.stringToColored.plain', setupStringToColored, (False,), 20),
+	('list.render.10', setupListCommand, (10,), 100),
+	('list.render.1000', setupListCommand, (1000,), 10),
+	('list.render.10000', setupListCommand, (10000,), 5),
+	('tools.camelCase', setupCamelCase, (), 20),
+	('generate.modules.100', setupGenerate, (100,), 5),
+	('generate.unchanged.100', setupRegenerate, (100,), 5),
+	('generate.archive.100', setupArchive, (100,), 5),
+	('commands.suggest.1000', setupSuggest, (1000,), 20),
+	('commands.suggest.50000', setupSuggest, (50000,), 20)
+]
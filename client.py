@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+if sys.argv[1:2] == ['_complete']:
+	from console.Completion import Completion
+	sys.exit(Completion('AliceConsole', 'console.Application.Application').run(sys.argv[2:]))
+
+from console.daemon.DaemonClient import DaemonClient
+
+sys.exit(DaemonClient().run(sys.argv[1:]))
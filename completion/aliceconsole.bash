@@ -0,0 +1,22 @@
+# Bash completion for AliceConsole
+#
+# Usage: source completion/aliceconsole.bash
+
+_aliceconsole()
+{
+	local candidate
+	local script="${COMP_WORDS[0]/#\~/$HOME}"
+
+	COMPREPLY=()
+
+	# Run through PATH, the script name alone is not a file python can open
+	if [[ "$script" != */* && ! -f "$script" ]]; then
+		script="$(command -v -- "$script")" || return
+	fi
+
+	while IFS= read -r candidate; do
+		COMPREPLY+=("$candidate")
+	done < <("${ALICECONSOLE_PYTHON:-python3}" "$script" _complete --shell=bash "${COMP_LINE:0:COMP_POINT}" 2>/dev/null)
+}
+
+complete -o default -F _aliceconsole main.py ./main.py client.py ./client.py
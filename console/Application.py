@@ -9,6 +9,9 @@
  # file that was distributed with this source code.
 ###
 
+import os
+import time
+
 from console.ConsoleApplication import ConsoleApplication
 
 #
@@ -19,24 +22,56 @@ class Application(ConsoleApplication):
 
 	def __init__(self):
 		self.commandsRegistered = False
+		self.container = {}
 		super(Application, self).__init__('AliceConsole', 1)
+		self.registerListeners()
 
 
-	def run(self, input = None):
-		self.container = {}
+	def run(self, input = None, output = None):
+		self.boot()
 
+		return super(Application, self).run(input, output)
+
+	def boot(self):
 		if not self.commandsRegistered:
+			start = time.perf_counter()
 			self.registerCommands()
 			self.commandsRegistered = True
+			self.addStartupPhase('register', start)
+
+	def warmUp(self):
+		self.boot()
+
+		return super(Application, self).warmUp()
+
+	def add(self, command):
+		command.setContainer(self.container)
+
+		return super(Application, self).add(command)
+
+	def registerListeners(self):
+		jsonLinesPath = os.environ.get('ALICECONSOLE_EVENTS_JSONL')
+		prometheusPath = os.environ.get('ALICECONSOLE_PROMETHEUS_TEXTFILE')
+
+		if not jsonLinesPath and not prometheusPath:
+			return
+
+		from console.EventDispatcher import EventDispatcher
+		dispatcher = self.getDispatcher() or EventDispatcher()
+
+		if jsonLinesPath:
+			from console.event.JsonLinesListener import JsonLinesListener
+			JsonLinesListener(jsonLinesPath).subscribe(dispatcher)
 
-		for k,command in self.commands.items():
-			command.setContainer(self.container)
+		if prometheusPath:
+			from console.event.PrometheusListener import PrometheusListener
+			PrometheusListener(prometheusPath).subscribe(dispatcher)
 
-		return super(Application, self).run(input)
+		self.setDispatcher(dispatcher)
 
 	def registerCommands(self):
-		from console.command.ModuleGenerateCommand import ModuleGenerateCommand
-		self.add(ModuleGenerateCommand())
+		self.register('module:generate', 'console.command.ModuleGenerateCommand.ModuleGenerateCommand')
+		self.register('module:generate-batch', 'console.command.ModuleGenerateBatchCommand.ModuleGenerateBatchCommand')
 		return True
 		# bundles = self.container.get('Application').getBundles()
 		#
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import asyncio
+import functools
+import threading
+
+#
+# AsyncTools
+#
+# Helpers for async commands, imported on first use only: asyncio is not loaded by synchronous commands.
+#
+
+async def gather(awaitables, limit = None, timeout = None, returnExceptions = False):
+	# Results keep the order of awaitables, at most limit of them run at once and each gets timeout seconds
+	semaphore = asyncio.Semaphore(limit) if limit else None
+
+	async def guard(awaitable):
+		if timeout is not None:
+			awaitable = asyncio.wait_for(awaitable, timeout)
+
+		if semaphore is None:
+			return await awaitable
+
+		async with semaphore:
+			return await awaitable
+
+	return await asyncio.gather(*[guard(awaitable) for awaitable in awaitables], return_exceptions=returnExceptions)
+
+async def withTimeout(awaitable, timeout):
+	return await asyncio.wait_for(awaitable, timeout)
+
+async def runBlocking(function, *args, **kwargs):
+	# Blocking calls (file system, DNS...) run in the default executor of the loop
+	return await asyncio.get_running_loop().run_in_executor(None, functools.partial(function, *args, **kwargs))
+
+async def runInThread(function, *args, **kwargs):
+	# Like runBlocking, on a daemon thread of its own: a call that may never return (a prompt) cannot block the exit
+	loop = asyncio.get_running_loop()
+	future = loop.create_future()
+
+	def settle(method, value):
+		if not future.done():
+			method(value)
+
+	def target():
+		try:
+			result = function(*args, **kwargs)
+		except BaseException as e:
+			loop.call_soon_threadsafe(settle, future.set_exception, e)
+		else:
+			loop.call_soon_threadsafe(settle, future.set_result, result)
+
+	threading.Thread(target=target, daemon=True).start()
+
+	return await future
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import io
+from contextlib import redirect_stdout, redirect_stderr
+
+from console.Output import Output
+
+#
+# BatchWorker runs batch jobs inside the worker processes of a parallel batch
+#
+# The application is set by the parent right before the pool is forked, each worker therefore
+# starts with a warm copy of it. stdout and stderr of a job are captured and sent back with its result.
+#
+
+application = None
+
+def setApplication(instance):
+	global application
+	application = instance
+
+def initWorker():
+	# A forked worker must not drive the event loop of its parent
+	application.setEventLoop(None)
+
+def runJob(job):
+	stdout = io.StringIO()
+	stderr = io.StringIO()
+
+	with redirect_stdout(stdout), redirect_stderr(stderr):
+		output = Output(stdout, stderr)
+		lineNumber, line, exitCode, duration, _, _ = application.runBatchJob(job, output)
+		output.flush()
+
+	return (lineNumber, line, exitCode, duration, stdout.getvalue(), stderr.getvalue())
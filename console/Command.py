@@ -13,21 +13,30 @@ import os
 import sys
 import re
 import getpass
-from prompt_toolkit import prompt
-from colorama import Fore, Back, Style
 
 from console.input.InputArgument import InputArgument
 from console.input.InputDefinition import InputDefinition
 from console.input.InputOption import InputOption
+from console.Output import Output
+from console.event.ConsoleEvent import ConsoleEvent
+from console.Markup import colorize, stripMarkup, foreground, background
 from console.Tools import indexOf
 
-REGEX_COLOR = re.compile(r'<(fg|bg):([a-z]+)>')
+# Box-drawing characters shared by every command unless one sets its own with setArrayChars()
+ARRAY_CHARS = { 'top': '═' , 'top-mid': '╤' , 'top-left': '╔' , 'top-right': '╗'
+	, 'bottom': '═' , 'bottom-mid': '╧' , 'bottom-left': '╚' , 'bottom-right': '╝'
+	, 'left': '║', 'left-mid': '╟' , 'mid': '─' , 'mid-mid': '┼'
+	, 'right': '║' , 'right-mid': '╢' , 'middle': '│' }
 
 #
 # Command provides an architecture for bundle's commands
 #
 class Command:
 
+	# Concrete commands keep a __dict__ for their own attributes
+	__slots__ = ('name', 'synopsis', 'application', 'container', 'aliases', 'description', 'definition', 'mergedDefinition',
+		'help', 'applicationDefinitionMerged', 'applicationDefinitionMergedWithArgs', 'validationErrorsIgnored', 'chars', 'output', 'profiler')
+
 	BLACK = 'black'
 	RED = 'red'
 	GREEN = 'green'
@@ -47,9 +56,12 @@ class Command:
 		self.help = 'No help'
 		self.applicationDefinitionMerged = False
 		self.applicationDefinitionMergedWithArgs = False
-		self.ignoreValidationErrors = False
+		self.validationErrorsIgnored = False
 		self.definition = InputDefinition()
-		self.chars = {}
+		self.mergedDefinition = None
+		self.chars = None
+		self.output = None
+		self.profiler = None
 
 		if name:
 			self.setName(name)
@@ -73,6 +85,25 @@ class Command:
 	def getContainer(self):
 		return self.container
 
+	def setProfiler(self, profiler):
+		self.profiler = profiler
+
+		return self
+
+	def getProfiler(self):
+		return self.profiler
+
+	def setOutput(self, output):
+		self.output = output
+
+		return self
+
+	def getOutput(self):
+		if self.output is None:
+			self.output = Output()
+
+		return self.output
+
 	def setApplication(self, application):
 		self.application = application
 
@@ -113,30 +144,36 @@ class Command:
 		return self.aliases
 
 	def ignoreValidationErrors(self):
-		self.ignoreValidationErrors = True
+		self.validationErrorsIgnored = True
 
 	def isEnabled(self):
 		return True
 
 	def getArrayChars(self):
-		if len(self.chars) != 0:
+		if self.chars:
 			return self.chars
 
-		self.chars = { 'top': '═' , 'top-mid': '╤' , 'top-left': '╔' , 'top-right': '╗'
-		, 'bottom': '═' , 'bottom-mid': '╧' , 'bottom-left': '╚' , 'bottom-right': '╝'
-		, 'left': '║', 'left-mid': '╟' , 'mid': '─' , 'mid-mid': '┼'
-		, 'right': '║' , 'right-mid': '╢' , 'middle': '│' }
-
-		return self.chars
+		return ARRAY_CHARS
 
 	def setArrayChars(self, chars):
 		self.chars = chars
 
+	def setAliases(self, aliases):
+		for alias in aliases:
+			self.validateName(alias)
+
+		self.aliases = aliases
+
+		return self
+
 	def getProcessedHelp(self):
-		name = self.name
+		return Command.processHelp(self.name, self.getHelp())
+
+	@staticmethod
+	def processHelp(name, help):
 		executeCommand = '{} {}'.format(sys.argv[0], os.path.basename(sys.argv[1]))
 
-		replaced = self.getHelp()
+		replaced = help
 		reg = re.compile(r'%command.name%')
 		replaced = re.sub(reg, name, replaced)
 		reg2 = re.compile(r'%command.full_name%')
@@ -150,33 +187,99 @@ class Command:
 
 		return self
 
-	def run(self, inputInstance):
+	def run(self, inputInstance, output = None):
+		profiler = self.profiler
+
+		if output is not None:
+			self.output = output
+
+		if profiler is not None:
+			profiler.mark('synopsis')
+
 		self.getSynopsis()
+
+		if profiler is not None:
+			profiler.mark('merge')
+
 		self.mergeApplicationDefinition()
 
+		if profiler is not None:
+			profiler.mark('bind')
+
 		try:
-			inputInstance.bind(self.definition)
+			inputInstance.bind(self.getMergedDefinition())
 		except ValueError as e:
-			if not self.ignoreValidationErrors:
+			if not self.validationErrorsIgnored:
 				raise ValueError(e)
 
-		hasInteract = True
+		dispatcher = self.application.getDispatcher() if self.application is not None else None
 
-		try:
-			self.interact(inputInstance)
-		except AttributeError:
-			hasInteract = False
+		if dispatcher is not None:
+			dispatcher.dispatch(ConsoleEvent.INPUT_BOUND, ConsoleEvent(self, inputInstance, self.output))
+
+		if inputInstance.isInteractive():
+			if profiler is not None:
+				profiler.mark('interact')
+
+			try:
+				interaction = self.interact(inputInstance)
+			except AttributeError:
+				interaction = None
+
+			self.wait(interaction)
+
+		if profiler is not None:
+			profiler.mark('validate')
 
 		inputInstance.validate()
 
-		return self.execute(inputInstance)
+		if profiler is not None:
+			profiler.mark('execute')
+
+			return profiler.call(inputInstance, self.doExecute, inputInstance)
+
+		return self.doExecute(inputInstance)
+
+	def doExecute(self, inputInstance):
+		return self.wait(self.execute(inputInstance))
 
-	def addOption(self, name, shortcut, mode, description, definition):
-		self.definition.addOption(InputOption(name, shortcut, mode, description, definition))
+	def wait(self, result):
+		# async def execute/interact return a coroutine, it runs to completion on the application loop
+		if not hasattr(result, '__await__'):
+			return result
+
+		try:
+			if self.application is not None:
+				return self.application.runCoroutine(result)
+
+			import asyncio
+			return asyncio.run(result)
+		except KeyboardInterrupt:
+			# Same as the synchronous prompts
+			sys.exit(0)
+
+	async def gather(self, awaitables, limit = None, timeout = None, returnExceptions = False):
+		from console import AsyncTools
+		return await AsyncTools.gather(awaitables, limit, timeout, returnExceptions)
+
+	async def withTimeout(self, awaitable, timeout):
+		from console import AsyncTools
+		return await AsyncTools.withTimeout(awaitable, timeout)
+
+	async def runBlocking(self, function, *args, **kwargs):
+		from console import AsyncTools
+		return await AsyncTools.runBlocking(function, *args, **kwargs)
+
+	def addOption(self, name, shortcut, mode, description, definition, choices = None):
+		self.definition.addOption(InputOption(name, shortcut, mode, description, definition, choices))
+		self.mergedDefinition = None
+		self.applicationDefinitionMerged = False
 		return self
 
-	def addArgument(self, name, mode, description, definition):
-		self.definition.addArgument(InputArgument(name, mode, description, definition))
+	def addArgument(self, name, mode, description, definition, choices = None):
+		self.definition.addArgument(InputArgument(name, mode, description, definition, choices))
+		self.mergedDefinition = None
+		self.applicationDefinitionMerged = False
 		return self
 
 	def validateName(self, name):
@@ -205,7 +308,15 @@ class Command:
 		else:
 			self.definition.setDefinition(definition)
 
+		self.mergedDefinition = None
 		self.applicationDefinitionMerged = False
+		self.applicationDefinitionMergedWithArgs = False
+
+	def getMergedDefinition(self):
+		if self.mergedDefinition is None:
+			return self.definition
+
+		return self.mergedDefinition
 
 	def mergeApplicationDefinition(self, mergeArgs = None):
 		if mergeArgs is None:
@@ -214,12 +325,9 @@ class Command:
 		if self.application is None or (self.applicationDefinitionMerged is True and (self.applicationDefinitionMergedWithArgs or not mergeArgs)):
 			return
 
-		if mergeArgs:
-			currentArguments = self.definition.getArguments()
-			self.definition.setArguments(self.application.getDefinition().getArguments())
-			self.definition.addArguments(currentArguments)
-
-		self.definition.addOptions(self.application.getDefinition().getOptions())
+		# The native definition is left untouched, the merged one is frozen and shared with every
+		# command declaring the same definition
+		self.mergedDefinition = InputDefinition.merge(self.application.getDefinition(), self.definition, mergeArgs)
 		self.applicationDefinitionMerged = True
 
 		if mergeArgs:
@@ -230,6 +338,7 @@ class Command:
 
 		try:
 			questionStyled = self.stringToColored(question, fgColor, bgColor)
+			self.getOutput().flush()
 
 			if hidden:
 				inputValue = getpass.getpass(questionStyled)
@@ -278,44 +387,51 @@ class Command:
 	def askConfirmation(self, question, definition, caseSensitive = False, fgColor='reset', bgColor='reset'):
 		return self.askCombo(question, definition,['y', 'n', 'yes', 'no'], caseSensitive, fgColor, bgColor)
 
+	async def askAsync(self, question = '', definition = None, hidden = False, fgColor='reset', bgColor='reset'):
+		# The answer is waited for on a thread, tasks started before the question keep running meanwhile
+		from console import AsyncTools
+		return await AsyncTools.runInThread(self.ask, question, definition, hidden, fgColor, bgColor)
+
+	async def askComboAsync(self, question, definition, choices, caseSensitive = False, fgColor='reset', bgColor='reset'):
+		from console import AsyncTools
+		return await AsyncTools.runInThread(self.askCombo, question, definition, choices, caseSensitive, fgColor, bgColor)
+
+	async def askAndValidateAsync(self, question = '', definition = None, callback = None, hidden = False, fgColor='reset', bgColor='reset'):
+		inputValue = await self.askAsync(question, definition, hidden, fgColor, bgColor)
+
+		if inputValue == '' and definition:
+			inputValue = definition
+
+		if not callback:
+			return inputValue
+
+		# The callback may itself be async, to check the answer against the result of a background task
+		result = callback(inputValue)
+
+		if hasattr(result, '__await__'):
+			result = await result
+
+		return result
+
+	async def askConfirmationAsync(self, question, definition, caseSensitive = False, fgColor='reset', bgColor='reset'):
+		return await self.askComboAsync(question, definition, ['y', 'n', 'yes', 'no'], caseSensitive, fgColor, bgColor)
+
 	def _getForegroundColor(self, color = 'reset'):
-		if color == 'black': return Fore.BLACK
-		if color == 'red': return Fore.RED
-		if color == 'green': return Fore.GREEN
-		if color == 'yellow': return Fore.YELLOW
-		if color == 'blue': return Fore.BLUE
-		if color == 'magenta': return Fore.MAGENTA
-		if color == 'cyan': return Fore.CYAN
-		if color == 'white': return Fore.WHITE
-		return Fore.RESET
+		return foreground(color)
 
 	def _getBackgroundColor(self, color = 'reset'):
-		if color == 'black': return Back.BLACK
-		if color == 'red': return Back.RED
-		if color == 'green': return Back.GREEN
-		if color == 'yellow': return Back.YELLOW
-		if color == 'blue': return Back.BLUE
-		if color == 'magenta': return Back.MAGENTA
-		if color == 'cyan': return Back.CYAN
-		if color == 'white': return Back.WHITE
-		return Back.RESET
+		return background(color)
 
 	def stringToColored(self, string, fgColor='reset', bgColor='reset'):
-		fgColor = self._getForegroundColor(color=fgColor)
-		bgColor = self._getBackgroundColor(color=bgColor)
-
-		colorsPairs = REGEX_COLOR.findall(string)
-
-		for colorPair in colorsPairs:
-			(type, color) = colorPair
-			string = string.replace('<{}:{}>'.format(type, color), self._getBackgroundColor(color) if type == 'bg' else self._getForegroundColor(color))
+		if not self.getOutput().isDecorated():
+			return stripMarkup(string)
 
-		return bgColor + fgColor + string + Fore.RESET + Back.RESET
+		return colorize(string, fgColor, bgColor)
 
 	def write(self, data, fgColor='reset', bgColor='reset'):
-		print(self.stringToColored(data, fgColor, bgColor))
+		self.getOutput().writeln(self.stringToColored(data, fgColor, bgColor))
 
 	def nl(self):
-		print('')
+		self.getOutput().writeln()
 
 
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import heapq
+import collections
+from array import array
+
+#
+# CommandMatcher suggests the command names closest to a mistyped one
+#
+# Names are indexed by their bigrams, so only the names sharing the most bigrams with the typed one
+# are compared with a bounded Levenshtein distance instead of scanning every known name. Namespaced names
+# share the bigrams of their namespace, so the rarest bigrams are read first and reading stops once
+# POSTINGS names were counted: a lookup costs the same with a hundred or fifty thousand commands.
+#
+# The index is the names joined in a single string with their packed offsets, the targets of aliases and,
+# per bigram, the packed ids of the names holding it. The command manifest stores it so it is not rebuilt
+# on every failed lookup, and loading it creates no object per name: a lookup only slices out the names
+# it compares.
+#
+class CommandMatcher:
+
+	CANDIDATES = 50
+
+	POSTINGS = 10000
+
+	def __init__(self, index = None):
+		self.names = None
+		self.ids = None
+
+		if index is None:
+			self.names, self.text, self.offsets, self.targets, self.grams = [], None, None, {}, {}
+		else:
+			self.text, offsets, self.targets, self.grams = index
+			self.offsets = array('I', offsets)
+
+	def getIndex(self):
+		names = self.getNames()
+		offsets = array('I', [0])
+
+		for name in names:
+			offsets.append(offsets[-1] + len(name))
+
+		return (''.join(names), offsets.tobytes(), self.targets, {gram: self.getPostings(gram).tobytes() for gram in self.grams})
+
+	def getNames(self):
+		if self.names is None:
+			self.names = [self.getName(id) for id in range(len(self.offsets) - 1)]
+			self.text = self.offsets = None
+
+		return self.names
+
+	def getName(self, id):
+		if self.names is not None:
+			return self.names[id]
+
+		return self.text[self.offsets[id]:self.offsets[id + 1]]
+
+	def getPostings(self, gram):
+		postings = self.grams.get(gram)
+
+		if type(postings) is bytes:
+			postings = self.grams[gram] = array('I', postings)
+
+		return postings
+
+	@staticmethod
+	def getGrams(word):
+		word = ' {} '.format(word.lower())
+		return {word[i:i + 2] for i in range(len(word) - 1)}
+
+	@staticmethod
+	def distance(left, right, tolerance):
+		if abs(len(left) - len(right)) > tolerance:
+			return None
+
+		# A common prefix or suffix does not change the distance, names of a namespace share a long one
+		start = 0
+
+		while start < len(left) and start < len(right) and left[start] == right[start]:
+			start += 1
+
+		left, right = left[start:], right[start:]
+		end = 0
+
+		while end < len(left) and end < len(right) and left[-1 - end] == right[-1 - end]:
+			end += 1
+
+		left, right = left[:len(left) - end], right[:len(right) - end]
+
+		previous = list(range(len(right) + 1))
+
+		for i, leftChar in enumerate(left, 1):
+			current = [i]
+
+			for j, rightChar in enumerate(right, 1):
+				current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (leftChar != rightChar)))
+
+			if min(current) > tolerance:
+				return None
+
+			previous = current
+
+		return previous[-1] if previous[-1] <= tolerance else None
+
+	def add(self, word, target = None):
+		names = self.getNames()
+
+		if self.ids is None:
+			self.ids = {name: id for id, name in enumerate(names)}
+
+		if word in self.ids:
+			return self
+
+		id = self.ids[word] = len(names)
+		names.append(word)
+
+		if target is not None and target != word:
+			self.targets[id] = target
+
+		for gram in self.getGrams(word):
+			postings = self.getPostings(gram)
+
+			if postings is None:
+				postings = self.grams[gram] = array('I')
+
+			postings.append(id)
+
+		return self
+
+	def match(self, word, limit = 5):
+		shared = collections.Counter()
+		postings = [self.getPostings(gram) for gram in self.getGrams(word) if gram in self.grams]
+		read = 0
+
+		for postings in sorted(postings, key=len):
+			if read and read + len(postings) > self.POSTINGS:
+				break
+
+			shared.update(postings[:self.POSTINGS])
+			read += len(postings)
+
+		tolerance = len(word) // 3 + 1
+		best = {}
+
+		# Names sharing as many bigrams are many once the common ones are skipped, the closest lengths go first
+		getName = self.getName
+		size = len(word)
+		common = shared.most_common(self.CANDIDATES)
+		candidates = [id for id, count in shared.items() if count >= common[-1][1]] if common else []
+
+		for id in heapq.nlargest(self.CANDIDATES, candidates, key=lambda id: (shared[id], -abs(len(getName(id)) - size))):
+			candidate = getName(id)
+			distance = self.distance(word.lower(), candidate.lower(), tolerance)
+
+			if candidate.startswith(word + ':'):
+				distance = 0
+
+			if distance is None:
+				continue
+
+			target = self.targets.get(id, candidate)
+
+			if target not in best or distance < best[target]:
+				best[target] = distance
+
+		return sorted(best, key=lambda target: (best[target], target))[:limit]
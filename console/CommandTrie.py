@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import bisect
+
+#
+# CommandTrie resolves command names, aliases and their abbreviations ('mod:generate-b' for 'module:generate-batch')
+#
+# Names are split on ':' and every segment leads to the node of the next namespace level. A node keeps its
+# segments sorted, on the first abbreviation only, so an abbreviated segment is resolved by bisecting them.
+# A segment matching exactly wins over longer ones. Adding a name costs a dict lookup per segment, whatever
+# the number of commands.
+#
+class CommandTrieNode:
+
+	__slots__ = ('children', 'keys', 'targets')
+
+	def __init__(self):
+		self.children = {}
+		self.keys = None
+		self.targets = None
+
+	def getKeys(self):
+		if self.keys is None:
+			self.keys = sorted(self.children)
+
+		return self.keys
+
+
+class CommandTrie:
+
+
+	def __init__(self):
+		self.root = CommandTrieNode()
+
+	def add(self, name, target = None):
+		if target is None:
+			target = name
+
+		node = self.root
+
+		for segment in name.split(':'):
+			child = node.children.get(segment)
+
+			if child is None:
+				child = node.children[segment] = CommandTrieNode()
+				node.keys = None
+
+			node = child
+
+		if node.targets is None:
+			node.targets = set()
+
+		node.targets.add(target)
+
+		return self
+
+	def resolve(self, name):
+		segments = name.split(':')
+		nodes = [self.root]
+
+		for i, segment in enumerate(segments):
+			last = i == len(segments) - 1
+			matched = []
+
+			for node in nodes:
+				child = node.children.get(segment)
+
+				if child is not None and (child.targets if last else child.children):
+					matched.append(child)
+					continue
+
+				keys = node.getKeys()
+				index = bisect.bisect_left(keys, segment)
+
+				while index < len(keys) and keys[index].startswith(segment):
+					child = node.children[keys[index]]
+
+					if child.targets if last else child.children:
+						matched.append(child)
+
+					index += 1
+
+			if last:
+				targets = set()
+
+				for node in matched:
+					targets.update(node.targets)
+
+				return sorted(targets)
+
+			nodes = matched
+
+		return []
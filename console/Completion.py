@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import sys
+
+from console.loader.CommandManifest import CommandManifest
+
+#
+# Completion answers the shell completion scripts (main.py _complete [--shell=bash|zsh] "<line>")
+#
+# Candidates are computed from the command manifest only: the application and its commands are not
+# built, prompt_toolkit and colorama are not imported. The application is only built when the manifest
+# is missing or one of the source files it was built from has changed, to refresh it.
+#
+class Completion:
+
+	VALUE_REQUIRED = 2
+
+	def __init__(self, applicationName, applicationFactory):
+		self.applicationName = applicationName
+		self.applicationFactory = applicationFactory
+		self.manifest = None
+
+	def getManifest(self):
+		if self.manifest is None:
+			manifest = CommandManifest(CommandManifest.getDefaultPath(self.applicationName))
+
+			if not manifest.isUpToDate():
+				manifest = self.createApplication().getCommandManifest()
+
+			self.manifest = manifest
+
+		return self.manifest
+
+	def createApplication(self):
+		import importlib
+
+		moduleName, className = self.applicationFactory.rsplit('.', 1)
+		application = getattr(importlib.import_module(moduleName), className)()
+		application.warmUp()
+
+		return application
+
+	def run(self, argv):
+		shell = 'bash'
+
+		if argv and argv[0].startswith('--shell='):
+			shell = argv[0][8:]
+			argv = argv[1:]
+
+		words = self.split(argv[0] if argv else '')
+
+		for candidate in self.complete(words[1:-1], words[-1], shell):
+			sys.stdout.write(candidate + '\n')
+
+		return 0
+
+	@staticmethod
+	def split(line):
+		# Same rules as the shell, an unterminated quote or escape is the word being completed (shlex would raise)
+		words = []
+		word = None
+		quote = None
+		escaped = False
+
+		for char in line:
+			if escaped:
+				word = (word or '') + char
+				escaped = False
+			elif char == '\\' and quote != '\'':
+				escaped = True
+			elif quote is not None:
+				if char == quote:
+					quote = None
+				else:
+					word += char
+			elif char in '"\'':
+				quote = char
+				word = word or ''
+			elif char.isspace():
+				if word is not None:
+					words.append(word)
+					word = None
+			else:
+				word = (word or '') + char
+
+		words.append(word or '')
+
+		return words
+
+	def complete(self, words, current, shell = 'bash'):
+		manifest = self.getManifest()
+		definition = manifest.getApplication()['definition']
+		options = list(definition['options'])
+		arguments = list(definition['arguments'])
+		positionals = 0
+		pending = None
+
+		for word in words:
+			if pending is not None:
+				pending = None
+			elif word.startswith('--'):
+				option = self.findOption(options, word[2:].split('=', 1)[0])
+
+				if option is not None and '=' not in word and option['mode'] & self.VALUE_REQUIRED:
+					pending = option
+			elif word.startswith('-') and len(word) > 1:
+				option = self.findOption(options, None, word[1])
+
+				if option is not None and len(word) == 2 and option['mode'] & self.VALUE_REQUIRED:
+					pending = option
+			else:
+				if positionals == 0:
+					entry = self.findCommand(manifest, word)
+
+					if entry is not None:
+						options += entry['definition']['options']
+						arguments += entry['definition']['arguments']
+
+				positionals += 1
+
+		if pending is not None:
+			candidates = self.getChoices(pending)
+		elif current.startswith('--') and '=' in current:
+			name = current[2:].split('=', 1)[0]
+			option = self.findOption(options, name)
+			candidates = ['--{}={}'.format(name, choice) for choice in self.getChoices(option)]
+		elif current.startswith('-'):
+			candidates = ['--' + option['name'] for option in options]
+
+			if not current.startswith('--'):
+				candidates += ['-' + shortcut for option in options for shortcut in (option['shortcut'] or '').split('|') if shortcut]
+		elif positionals == 0:
+			candidates = []
+
+			for name in manifest.getNames():
+				candidates.append(name)
+				candidates += manifest.get(name)['aliases']
+		elif arguments:
+			candidates = self.getChoices(arguments[min(positionals, len(arguments) - 1)])
+		else:
+			candidates = []
+
+		candidates = sorted(set(candidate for candidate in candidates if candidate.startswith(current)))
+
+		# bash splits words on ':' and '=', only the part after them is replaced
+		cut = max(current.rfind(':'), current.rfind('='))
+
+		if shell == 'bash' and cut >= 0:
+			candidates = [candidate[cut + 1:] for candidate in candidates]
+
+		return candidates
+
+	@staticmethod
+	def findOption(options, name, shortcut = None):
+		for option in options:
+			if name is not None and option['name'] == name:
+				return option
+
+			if shortcut is not None and shortcut in (option['shortcut'] or '').split('|'):
+				return option
+
+		return None
+
+	@staticmethod
+	def findCommand(manifest, name):
+		if manifest.has(name):
+			return manifest.get(name)
+
+		for candidate in manifest.getNames():
+			if name in manifest.get(candidate)['aliases']:
+				return manifest.get(candidate)
+
+		return None
+
+	@staticmethod
+	def getChoices(parameter):
+		if parameter is None or not parameter.get('choices'):
+			return []
+
+		return [str(choice) for choice in parameter['choices']]
@@ -9,19 +9,26 @@
  # file that was distributed with this source code.
 ###
 
+import os
 import sys
+import time
+import shlex
 import traceback
-from colorama import init
-from colorama import Fore, Back, Style
-init()
+import multiprocessing
 
 from console.input.ArgvInput import ArgvInput
 from console.input.ArrayInput import ArrayInput
-from console.command.HelpCommand import HelpCommand
-from console.command.ListCommand import ListCommand
 from console.input.InputArgument import InputArgument
 from console.input.InputDefinition import InputDefinition
 from console.input.InputOption import InputOption
+from console.Output import Output
+from console.Markup import foreground
+from console.Profiler import Profiler
+from console.event.ConsoleEvent import ConsoleEvent
+from console.CommandTrie import CommandTrie
+from console.CommandMatcher import CommandMatcher
+from console.loader.CommandManifest import CommandManifest
+from console.loader.FactoryCommandLoader import FactoryCommandLoader
 
 #
 # ConsoleApplication
@@ -30,16 +37,40 @@ class ConsoleApplication:
 
 
 	def __init__(self, name, version):
+		start = time.perf_counter()
 		self.name = name
 		self.version = version
 		self.verbose = 0
 		self.commands = {}
+		self.commandLoader = FactoryCommandLoader()
+		self.manifest = None
+		self.manifestFresh = False
+		self.trie = None
+		self.matcher = None
 		self.running = None
 		self.needHelp = False
+		self.autoExit = True
+		self.profiler = None
+		self.dispatcher = None
+		self.loop = None
+		self.startupPhases = []
 		self.definition = self.getDefaultInputDefinition()
 
-		for command in self.getDefaultCommands():
-			self.add(command)
+		# Only the Windows console needs colorama to translate the ANSI codes, Output handles the rest
+		if os.name == 'nt':
+			import colorama
+			colorama.init()
+
+		defaultCommands = self.getDefaultCommands()
+
+		# Overrides written before commands were loaded lazily return a list of Command instances
+		if isinstance(defaultCommands, dict):
+			for name, factory in defaultCommands.items():
+				self.register(name, factory)
+		else:
+			self.addCommands(defaultCommands)
+
+		self.addStartupPhase('construct', start)
 
 	def getDefinition(self):
 		return self.definition
@@ -50,15 +81,179 @@ class ConsoleApplication:
 			InputOption(name='--help',      	shortcut='-h', mode=InputOption.VALUE_NONE, description='Display this help message.'),
 			InputOption(name='--verbose',       shortcut='-v', mode=InputOption.VALUE_NONE, description='Increase the verbosity of messages'),
 			InputOption(name='--version',       shortcut='-V', mode=InputOption.VALUE_NONE, description='Display this application version.'),
-			InputOption(name='--no-interaction',shortcut='-n', mode=InputOption.VALUE_NONE, description='Do not ask any interactive question.')
+			InputOption(name='--no-interaction',shortcut='-n', mode=InputOption.VALUE_NONE, description='Do not ask any interactive question.'),
+			InputOption(name='--profile',       shortcut=None, mode=InputOption.VALUE_NONE, description='Time each phase of the run.'),
+			InputOption(name='--profile-output',shortcut=None, mode=InputOption.VALUE_REQUIRED, description='Write the phase timings as JSON to this file.'),
+			InputOption(name='--profile-stacks',shortcut=None, mode=InputOption.VALUE_REQUIRED, description='Profile execute into a .pstats or collapsed stacks file.')
 		])
 
 	def getDefaultCommands(self):
-		return [ListCommand(), HelpCommand()]
+		# Maps the name of each default command to its factory, see register(). A list of Command instances
+		# is still accepted from overrides, those commands are then built with the application.
+		return {
+			'list': 'console.command.ListCommand.ListCommand',
+			'help': 'console.command.HelpCommand.HelpCommand',
+			'batch': 'console.command.BatchCommand.BatchCommand'
+		}
 
 	def getCommands(self):
+		# Every registered command is built, which imports its module: list and help read the manifest instead
+		for name in self.getCommandNames():
+			if name in self.commands:
+				continue
+
+			try:
+				self.get(name)
+			except Exception:
+				# Reported when the manifest is refreshed
+				continue
+
 		return self.commands
 
+	def addStartupPhase(self, name, start):
+		self.startupPhases.append((name, start, time.perf_counter()))
+
+		return self
+
+	def resetStartupPhases(self):
+		startupPhases = self.startupPhases
+		self.startupPhases = []
+
+		return startupPhases
+
+	def setCommandLoader(self, commandLoader):
+		self.commandLoader = commandLoader
+		self.manifestFresh = False
+
+		return self
+
+	def getCommandLoader(self):
+		return self.commandLoader
+
+	def register(self, name, factory):
+		self.commandLoader.add(name, factory)
+		self.manifestFresh = False
+
+		return self
+
+	def setCommandManifest(self, manifest):
+		self.manifest = manifest
+		self.manifestFresh = False
+
+		return self
+
+	def getCommandManifest(self):
+		if self.manifest is None:
+			self.manifest = CommandManifest(CommandManifest.getDefaultPath(self.getName()))
+
+		if not self.manifestFresh:
+			self.refreshCommandManifest()
+
+		return self.manifest
+
+	def getCommandTrie(self):
+		manifest = self.getCommandManifest()
+
+		if self.trie is None:
+			self.trie = CommandTrie()
+
+			for name in manifest.getNames():
+				self.trie.add(name)
+
+				for alias in manifest.get(name)['aliases']:
+					self.trie.add(alias, name)
+
+		return self.trie
+
+	def getCommandMatcher(self):
+		manifest = self.getCommandManifest()
+
+		if self.matcher is None:
+			index = manifest.getMatcherIndex()
+			self.matcher = CommandMatcher(index) if index is not None else self.buildCommandMatcher()
+
+		return self.matcher
+
+	def buildCommandMatcher(self):
+		matcher = CommandMatcher()
+
+		for name in self.manifest.getNames():
+			matcher.add(name)
+
+			for alias in self.manifest.get(name)['aliases']:
+				matcher.add(alias, name)
+
+		return matcher
+
+	def getCommandNotFoundMessage(self, name):
+		message = 'The command \'{}\' does not exist.'.format(str(name))
+		suggestions = self.getCommandMatcher().match(str(name))
+
+		if suggestions:
+			message += '\nDid you mean one of these?\n    {}'.format('\n    '.join(suggestions))
+
+		return message
+
+	def refreshCommandManifest(self):
+		names = self.getCommandNames()
+		stamps = {}
+
+		# Entries built against another application definition or base classes are dropped here
+		self.manifest.setApplication(CommandManifest.describeApplication(self))
+
+		for name in self.manifest.getNames():
+			if name not in names:
+				self.manifest.remove(name)
+
+		for name in names:
+			source = self.getCommandSource(name)
+
+			if source not in stamps:
+				stamps[source] = CommandManifest.getSourceStamp(source)
+
+			if self.manifest.isFresh(name, stamps[source]):
+				continue
+
+			try:
+				self.manifest.set(name, CommandManifest.describe(self.get(name), stamps[source]))
+			except ValueError:
+				self.manifest.remove(name)
+			except Exception as e:
+				# A broken factory, failing at import or in create(), must not take list and help down with it
+				import logging
+
+				logging.getLogger(__name__).warning('The command %s is skipped, it cannot be loaded: %s', name, e)
+				self.manifest.remove(name)
+
+		# Built when the commands change rather than on every mistyped name
+		if not self.manifest.hasMatcherIndex():
+			self.manifest.setMatcherIndex(self.buildCommandMatcher().getIndex())
+
+		self.manifest.save()
+		self.manifestFresh = True
+		self.trie = None
+		self.matcher = None
+
+	def getCommandSource(self, name):
+		if name not in self.commands and self.commandLoader.has(name):
+			return self.commandLoader.getSource(name)
+
+		module = sys.modules.get(self.commands[name].__class__.__module__)
+
+		return getattr(module, '__file__', None)
+
+	def getCommandNames(self):
+		names = set(self.commands)
+		names.update(self.commandLoader.getNames())
+
+		return sorted(names)
+
+	def getCommandDescription(self, name):
+		if name in self.commands:
+			return self.commands[name].getDescription()
+
+		return self.getCommandManifest().get(name)['description']
+
 	def add(self, command):
 		command.setApplication(self)
 
@@ -70,6 +265,7 @@ class ConsoleApplication:
 			raise ValueError('Command class {} is not correctly initialized. You probably forgot to call the parent constructor.'.format(str(command.__class__.__name__)))
 
 		self.commands[command.getName()] = command
+		self.manifestFresh = False
 
 		return command
 
@@ -78,13 +274,74 @@ class ConsoleApplication:
 			self.add(command)
 
 	def has(self, name):
-		return name in self.commands
+		return name in self.commands or self.commandLoader.has(name)
+
+	def setDispatcher(self, dispatcher):
+		self.dispatcher = dispatcher
+
+		return self
+
+	def getDispatcher(self):
+		return self.dispatcher
+
+	def getEventLoop(self):
+		# One loop runs every async command of the process, batch lines and daemon runs included
+		if self.loop is None or self.loop.is_closed():
+			import asyncio
+			self.loop = asyncio.new_event_loop()
+
+		return self.loop
+
+	def setEventLoop(self, loop):
+		self.loop = loop
+
+		return self
+
+	def runCoroutine(self, awaitable):
+		import asyncio
+
+		loop = self.getEventLoop()
+		task = asyncio.ensure_future(awaitable, loop=loop)
+
+		try:
+			return loop.run_until_complete(task)
+		except KeyboardInterrupt:
+			# Ctrl-C lands in the main thread while prompts wait on threads, the coroutine is cancelled before leaving
+			task.cancel()
+
+			try:
+				loop.run_until_complete(task)
+			except BaseException:
+				pass
+
+			raise
+
+	def closeEventLoop(self):
+		if self.loop is not None and not self.loop.is_closed():
+			self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+			self.loop.close()
+
+		self.loop = None
+
+	def setAutoExit(self, autoExit):
+		self.autoExit = autoExit
+
+		return self
+
+	def isAutoExitEnabled(self):
+		return self.autoExit
+
+	def warmUp(self):
+		self.getCommands()
+		self.getCommandManifest()
+
+		return self
 
 	def setVerbose(self, level):
 		self.verbose = level
 
 	def getCommandName(self, input):
-		return input.getFirstArgument()
+		return input.getFirstArgument(self.getDefinition())
 
 	def getName(self):
 		return self.name
@@ -113,39 +370,192 @@ class ConsoleApplication:
 
 		return versionMessage
 
-	def run(self, input = None):
+	def run(self, input = None, output = None):
 		if input is None:
 			input = ArgvInput()
 
+		if output is None:
+			output = Output()
+
+		if self.dispatcher is not None:
+			output.setDispatcher(self.dispatcher)
+
+		profiler = None
+		# Startup phases belong to the first run only, later runs (batch lines, daemon children) start idle
+		startupPhases = self.resetStartupPhases()
+
+		if input.hasParameterOption(Profiler.OPTIONS):
+			profiler = Profiler(startupPhases).mark('configure')
+
 		self.configureIO(input)
+		self.running = None
 		exitCode = -1
 
 		try:
-			exitCode = self.doRun(input)
+			if profiler is not None:
+				self.profiler = profiler.mark('resolve')
+
+			exitCode = self.doRun(input, output)
 		except ValueError as ve:
 			exitCode = 400
-			print(Fore.YELLOW + '[Error]' + Fore.RESET + ' Error with code {}'.format(exitCode))
-			print(Fore.YELLOW + '[Error]' + Fore.RESET + ' Message {}'.format(str(ve)))
+			self.dispatchError(ve, exitCode, input, output)
+			output.writeln(foreground('yellow') + '[Error]' + foreground('reset') + ' Error with code {}'.format(exitCode))
+			output.writeln(foreground('yellow') + '[Error]' + foreground('reset') + ' Message {}'.format(str(ve)))
 
 			if self.verbose > 0:
-				print(traceback.format_exc())
-				sys.exit(exitCode)
-			else:
+				output.writeln(traceback.format_exc())
+
+			if self.autoExit:
+				output.flush()
 				sys.exit(exitCode)
 
 		except Exception as e:
 			exitCode = 500
-			print(Fore.RED + '[Exception]' + Fore.RESET + ' Error with code {}'.format(exitCode))
-			print(Fore.RED + '[Exception]' + Fore.RESET + ' Message {}'.format(str(e)))
+			self.dispatchError(e, exitCode, input, output)
+			output.writeln(foreground('red') + '[Exception]' + foreground('reset') + ' Error with code {}'.format(exitCode))
+			output.writeln(foreground('red') + '[Exception]' + foreground('reset') + ' Message {}'.format(str(e)))
 			# print('\n Message: ' + str(self.running.getSynopsis()))
 
 			if self.verbose > 0:
-				print(traceback.format_exc())
+				output.writeln(traceback.format_exc())
+
+			if self.autoExit:
+				output.flush()
 				sys.exit(exitCode)
+
+		finally:
+			self.profiler = None
+			output.flush()
+
+			if profiler is not None:
+				profiler.report(input, output)
+
+			# Commands may leave with sys.exit(), the loop is closed on the way out
+			if self.autoExit:
+				self.closeEventLoop()
+
+		return exitCode
+
+	def dispatchError(self, error, exitCode, input, output):
+		# Errors of a running command are dispatched by dispatchCommand, these were raised before
+		if self.dispatcher is None or self.running is not None:
+			return
+
+		event = ConsoleEvent(None, input, output).setError(error).setExitCode(exitCode)
+		self.dispatcher.dispatch(ConsoleEvent.COMMAND_ERROR, event)
+
+	def runBatch(self, source, jobs = 1, ordered = True, output = None):
+		if isinstance(source, str):
+			if source == '-':
+				return self.runBatchLines(sys.stdin, jobs, ordered, output)
+
+			with open(source, 'r', encoding='utf-8') as lines:
+				return self.runBatchLines(lines, jobs, ordered, output)
+
+		return self.runBatchLines(source, jobs, ordered, output)
+
+	def runBatchLines(self, lines, jobs = 1, ordered = True, output = None):
+		if output is None:
+			output = Output()
+
+		autoExit = self.autoExit
+		running = self.running
+		count = 0
+		failed = 0
+		batchStart = time.perf_counter()
+		self.setAutoExit(False)
+
+		try:
+			batchJobs = self.parseBatchLines(lines)
+
+			if jobs > 1:
+				results = self.runBatchParallel(batchJobs, jobs, ordered)
 			else:
-				sys.exit(exitCode)
+				results = (self.runBatchJob(job, output) for job in batchJobs)
+
+			for lineNumber, line, exitCode, duration, stdout, stderr in results:
+				# Output captured by a worker is released in one piece, right before its status line
+				if stdout:
+					output.write(stdout)
+
+				if stderr:
+					output.getErrorOutput().write(stderr)
+
+				count += 1
+
+				if exitCode != 0:
+					failed += 1
+
+				color = foreground('green') if exitCode == 0 else foreground('red')
+				output.writeln(color + '[Batch]' + foreground('reset') + ' Line {} exited with code {} in {:.3f} ms : {}'.format(lineNumber, exitCode, duration, line))
+		finally:
+			self.setAutoExit(autoExit)
+			self.running = running
+
+		output.writeln('[Batch] {} command(s) run in {:.3f} ms, {} failed'.format(count, (time.perf_counter() - batchStart) * 1000, failed))
+		output.flush()
+
+		return 0 if failed == 0 else 1
+
+	def parseBatchLines(self, lines):
+		for lineNumber, line in enumerate(lines, 1):
+			try:
+				argv = shlex.split(line, comments=True)
+			except ValueError as ve:
+				# An unbalanced quote fails its own line, the batch goes on
+				yield (lineNumber, line.strip(), None, ve)
+				continue
+
+			if len(argv) != 0:
+				yield (lineNumber, line.strip(), argv, None)
 
-		# return exitCode
+	def runBatchParallel(self, batchJobs, jobs, ordered):
+		from console import BatchWorker
+
+		# Workers are forked from this process, so every command is imported once here
+		self.warmUp()
+		BatchWorker.setApplication(self)
+
+		with multiprocessing.get_context('fork').Pool(jobs, BatchWorker.initWorker) as pool:
+			mapper = pool.imap if ordered else pool.imap_unordered
+
+			for result in mapper(BatchWorker.runJob, batchJobs):
+				yield result
+
+	def runBatchJob(self, job, output):
+		lineNumber, line, argv, error = job
+
+		if error is not None:
+			output.writeln(foreground('yellow') + '[Error]' + foreground('reset') + ' Error with code {}'.format(400))
+			output.writeln(foreground('yellow') + '[Error]' + foreground('reset') + ' Message Line {} could not be parsed: {}'.format(lineNumber, str(error)))
+
+			return (lineNumber, line, 400, 0.0, None, None)
+
+		verbose = self.verbose
+		start = time.perf_counter()
+		exitCode = self.runBatchLine(argv, output)
+		duration = (time.perf_counter() - start) * 1000
+		self.setVerbose(verbose)
+
+		return (lineNumber, line, exitCode, duration, None, None)
+
+	def runBatchLine(self, argv, output):
+		input = ArgvInput(argv)
+		input.setInteractive(False)
+
+		try:
+			exitCode = self.run(input, output)
+		except SystemExit as e:
+			exitCode = e.code
+
+		return self.normalizeExitCode(exitCode)
+
+	@staticmethod
+	def normalizeExitCode(exitCode):
+		if exitCode is None:
+			return 0
+
+		return exitCode if isinstance(exitCode, int) else 1
 
 	def configureIO(self, input):
 		if input.hasParameterOption(['--no-interaction', '-n']):
@@ -154,9 +564,9 @@ class ConsoleApplication:
 		if input.hasParameterOption(['--verbose', '-v']):
 			self.setVerbose(1)
 
-	def doRun(self, input):
+	def doRun(self, input, output):
 		if input.hasParameterOption(['--version', '-V']):
-			print(self.getLongVersion())
+			output.writeln(self.getLongVersion())
 			return 0
 
 		name = self.getCommandName(input)
@@ -174,30 +584,84 @@ class ConsoleApplication:
 
 		command = self.find(name)
 		self.running = command
-		exitCode = self.doRunCommand(command=command, input=input)
+		exitCode = self.doRunCommand(command=command, input=input, output=output)
 		self.running = None
 
 		return exitCode
 
-	def doRunCommand(self, command, input):
-		return command.run(input)
+	def doRunCommand(self, command, input, output):
+		# Only the command of the profiled run is instrumented, not the ones it runs in turn
+		profiler = self.profiler
+		self.profiler = None
+
+		if profiler is None:
+			return self.dispatchCommand(command, input, output)
+
+		command.setProfiler(profiler)
+
+		try:
+			return self.dispatchCommand(command, input, output)
+		finally:
+			command.setProfiler(None)
+
+	def dispatchCommand(self, command, input, output):
+		dispatcher = self.dispatcher
+
+		if dispatcher is None:
+			return command.run(input, output)
+
+		event = ConsoleEvent(command, input, output)
+		dispatcher.dispatch(ConsoleEvent.COMMAND_START, event)
+		start = time.perf_counter()
+
+		try:
+			exitCode = command.run(input, output)
+			event.setExitCode(self.normalizeExitCode(exitCode))
+		except SystemExit as e:
+			event.setExitCode(self.normalizeExitCode(e.code))
+			raise
+		except Exception as e:
+			event.setError(e).setExitCode(400 if isinstance(e, ValueError) else 500)
+			dispatcher.dispatch(ConsoleEvent.COMMAND_ERROR, event)
+			raise
+		finally:
+			event.setDuration(time.perf_counter() - start)
+			dispatcher.dispatch(ConsoleEvent.COMMAND_TERMINATE, event)
+
+		return exitCode
 
 	def find(self, name):
-		return self.get(name)
+		return self.get(self.resolveName(name))
 
-	def get(self, name):
-		if name not in self.commands or self.commands[name] is None:
-			raise ValueError('The command \'{}\' does not exist.'.format(str(name)))
+	def resolveName(self, name):
+		if self.has(name):
+			return name
 
-		command = self.commands[name]
+		names = self.getCommandTrie().resolve(name)
 
+		if len(names) > 1:
+			raise ValueError('Command \'{}\' is ambiguous, did you mean one of these?\n    {}'.format(str(name), '\n    '.join(names)))
+
+		return names[0] if names else name
+
+	def get(self, name):
 		if self.needHelp:
 			self.needHelp = False
+
+			if not self.has(name):
+				raise ValueError(self.getCommandNotFoundMessage(name))
+
 			helpCommand = self.get('help')
-			helpCommand.setCommand(command)
+			helpCommand.setCommandName(name)
 			return helpCommand
 
-		return command
+		if name not in self.commands and self.commandLoader.has(name):
+			self.add(self.commandLoader.get(name))
+
+		if name not in self.commands or self.commands[name] is None:
+			raise ValueError(self.getCommandNotFoundMessage(name))
+
+		return self.commands[name]
 
 
 
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+#
+# EventDispatcher calls the listeners registered for an event
+#
+# Listeners are callables receiving the ConsoleEvent, called in registration order. An application
+# without listeners has no dispatcher at all, and dispatching an event nobody listens to is one lookup.
+# A failing listener is logged and skipped, it never changes the outcome of the command.
+#
+class EventDispatcher:
+
+
+	def __init__(self):
+		self.listeners = {}
+
+	def addListener(self, eventName, listener):
+		self.listeners.setdefault(eventName, []).append(listener)
+
+		return self
+
+	def removeListener(self, eventName, listener):
+		listeners = self.listeners.get(eventName)
+
+		if listeners and listener in listeners:
+			listeners.remove(listener)
+
+		return self
+
+	def getListeners(self, eventName):
+		return list(self.listeners.get(eventName, []))
+
+	def hasListeners(self, eventName):
+		return bool(self.listeners.get(eventName))
+
+	def dispatch(self, eventName, event):
+		listeners = self.listeners.get(eventName)
+
+		if not listeners:
+			return event
+
+		event.setName(eventName)
+
+		for listener in listeners:
+			try:
+				listener(event)
+			except Exception as e:
+				import logging
+
+				logging.getLogger(__name__).warning('Listener %s failed on %s: %s', getattr(listener, '__qualname__', repr(listener)), eventName, e)
+
+		return event
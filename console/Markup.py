@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import re
+from functools import lru_cache
+
+#
+# Markup compiles the <fg:color> / <bg:color> tags used by commands into ANSI escape codes
+#
+# Compiled templates are cached by template, so a string written repeatedly is only scanned once.
+# stripMarkup() is the no-color path: tags are removed and no escape code is produced.
+#
+
+REGEX_COLOR = re.compile(r'<(fg|bg):([a-z]+)>')
+
+COLORS = ['black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white']
+
+# Same codes as colorama's Fore and Back, unknown colors fall back to reset
+FOREGROUND = dict((color, '\x1b[{}m'.format(30 + i)) for i, color in enumerate(COLORS))
+FOREGROUND['reset'] = '\x1b[39m'
+
+BACKGROUND = dict((color, '\x1b[{}m'.format(40 + i)) for i, color in enumerate(COLORS))
+BACKGROUND['reset'] = '\x1b[49m'
+
+RESET = FOREGROUND['reset'] + BACKGROUND['reset']
+
+CACHE_SIZE = 4096
+
+def foreground(color):
+	return FOREGROUND.get(color, FOREGROUND['reset'])
+
+def background(color):
+	return BACKGROUND.get(color, BACKGROUND['reset'])
+
+def _replaceTag(match):
+	if match.group(1) == 'bg':
+		return background(match.group(2))
+
+	return foreground(match.group(2))
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compileMarkup(template):
+	if '<' not in template:
+		return template
+
+	return REGEX_COLOR.sub(_replaceTag, template)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def stripMarkup(template):
+	if '<' not in template:
+		return template
+
+	return REGEX_COLOR.sub('', template)
+
+def colorize(string, fgColor = 'reset', bgColor = 'reset'):
+	return background(bgColor) + foreground(fgColor) + compileMarkup(string) + RESET
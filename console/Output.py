@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import re
+import sys
+import time
+
+from console.event.ConsoleEvent import ConsoleEvent
+
+REGEX_ANSI = re.compile(r'\x1b\[[0-9;]*m')
+
+#
+# Output buffers what commands write and flushes it in large chunks
+#
+# On a terminal, or when decorated, the output is line buffered like print(): a line shows up as soon
+# as it is complete, even before long silent work. For pipes and files the buffer is flushed once it
+# holds bufferSize characters or when a write comes flushInterval seconds after the last flush.
+# When the stream is not a terminal, data is encoded and written straight to its binary buffer,
+# with color codes stripped, bypassing the text layer and the colorama wrapper. Setting NO_COLOR
+# disables colors on a terminal too.
+# stderr gets its own Output through getErrorOutput().
+#
+class Output:
+
+	BUFFER_SIZE = 65536
+	FLUSH_INTERVAL = 0.1
+
+	def __init__(self, stream = None, errorStream = None, bufferSize = None, flushInterval = None):
+		self.stream = stream if stream is not None else sys.stdout
+		self.errorStream = errorStream
+		self.errorOutput = None
+		self.bufferSize = bufferSize if bufferSize is not None else self.BUFFER_SIZE
+		self.flushInterval = flushInterval if flushInterval is not None else self.FLUSH_INTERVAL
+		self.buffer = []
+		self.bufferLength = 0
+		self.lastFlush = time.monotonic()
+		self.dispatcher = None
+
+		try:
+			isatty = self.stream.isatty()
+		except (AttributeError, ValueError):
+			isatty = False
+
+		self.isatty = isatty
+		self.decorated = isatty and not os.environ.get('NO_COLOR')
+		self.binary = None if isatty else getattr(self.stream, 'buffer', None)
+		self.encoding = getattr(self.stream, 'encoding', None) or 'utf-8'
+		self.errors = getattr(self.stream, 'errors', None) or 'strict'
+
+	def isDecorated(self):
+		return self.decorated
+
+	def setDecorated(self, decorated):
+		self.decorated = decorated
+
+		return self
+
+	def setDispatcher(self, dispatcher):
+		self.dispatcher = dispatcher
+
+		return self
+
+	def getErrorOutput(self):
+		if self.errorOutput is None:
+			errorStream = self.errorStream if self.errorStream is not None else sys.stderr
+			# Errors are not delayed
+			self.errorOutput = Output(errorStream, bufferSize=0, flushInterval=0)
+			self.errorOutput.errorOutput = self.errorOutput
+
+		return self.errorOutput
+
+	def write(self, text):
+		if not self.decorated and '\x1b' in text:
+			text = REGEX_ANSI.sub('', text)
+
+		self.buffer.append(text)
+		self.bufferLength += len(text)
+
+		if (self.isatty or self.decorated) and '\n' in text:
+			self.flush()
+		elif self.bufferLength >= self.bufferSize or time.monotonic() - self.lastFlush >= self.flushInterval:
+			self.flush()
+
+	def writeln(self, text = ''):
+		self.write(text + '\n')
+
+	def flush(self):
+		self.lastFlush = time.monotonic()
+
+		if self.bufferLength == 0:
+			return
+
+		data = ''.join(self.buffer)
+		self.buffer = []
+		self.bufferLength = 0
+
+		if self.binary is not None:
+			# Whatever was printed through the text layer goes out first
+			self.stream.flush()
+			self.binary.write(data.encode(self.encoding, self.errors))
+			self.binary.flush()
+		else:
+			self.stream.write(data)
+			self.stream.flush()
+
+		if self.dispatcher is not None:
+			self.dispatcher.dispatch(ConsoleEvent.OUTPUT_FLUSHED, ConsoleEvent(output=self).setSize(len(data)))
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import sys
+import time
+
+#
+# Profiler times the phases of a run, enabled by the global --profile, --profile-output=FILE and
+# --profile-stacks=FILE options
+#
+# Phases are consecutive: mark() ends the running phase and starts the next one. The breakdown is written
+# to the error output, or as JSON to the --profile-output FILE. With --profile-stacks, execute runs under
+# cProfile when FILE ends with .pstats, otherwise under a sampler writing collapsed stacks (flamegraph.pl
+# input) to FILE. When the options are absent no Profiler is built, the run is not instrumented and
+# nothing but this module is imported.
+#
+class Profiler:
+
+	OPTIONS = ['--profile', '--profile-output', '--profile-stacks']
+
+	SAMPLE_INTERVAL = 0.001
+
+	def __init__(self, phases = None):
+		self.phases = [[name, start, end] for name, start, end in (phases or [])]
+		self.current = None
+
+	def mark(self, name):
+		now = time.perf_counter()
+
+		if self.current is not None:
+			self.current[2] = now
+
+		self.current = [name, now, None]
+		self.phases.append(self.current)
+
+		return self
+
+	def stop(self):
+		if self.current is not None:
+			self.current[2] = time.perf_counter()
+			self.current = None
+
+		return self
+
+	def getPhases(self):
+		return [(name, start, end) for name, start, end in self.phases if end is not None]
+
+	@staticmethod
+	def getOption(input, name):
+		try:
+			return input.getOption(name)
+		except (ValueError, AttributeError):
+			# The run failed before the input was bound
+			return None
+
+	def call(self, input, callback, *args):
+		path = self.getOption(input, 'profile-stacks')
+
+		if not path:
+			return callback(*args)
+
+		if path.endswith('.pstats'):
+			import cProfile
+
+			profile = cProfile.Profile()
+
+			try:
+				return profile.runcall(callback, *args)
+			finally:
+				profile.dump_stats(path)
+
+		import threading
+
+		sampler = StackSampler(threading.get_ident(), self.SAMPLE_INTERVAL)
+		sampler.start()
+
+		try:
+			return callback(*args)
+		finally:
+			sampler.stop()
+			sampler.dump(path)
+
+	def report(self, input, output):
+		self.stop()
+		phases = self.getPhases()
+
+		if not phases:
+			return
+
+		origin = phases[0][1]
+		total = phases[-1][2] - origin
+		path = self.getOption(input, 'profile-output')
+		errorOutput = output.getErrorOutput()
+
+		if path:
+			import json
+
+			data = {
+				'total': total * 1000,
+				'phases': [{'name': name, 'start': (start - origin) * 1000, 'duration': (end - start) * 1000} for name, start, end in phases]
+			}
+
+			try:
+				with open(path, 'w', encoding='utf-8') as handle:
+					json.dump(data, handle, indent=4)
+			except OSError as e:
+				# The command already ran, its exit code is kept
+				errorOutput.writeln('[Profile] Could not write the profile to {}: {}'.format(path, str(e)))
+
+			return
+
+		for name, start, end in phases:
+			duration = end - start
+			errorOutput.writeln('[Profile] {:<12} {:10.3f} ms {:6.1f} %'.format(name, duration * 1000, duration * 100 / total if total else 0))
+
+		errorOutput.writeln('[Profile] {:<12} {:10.3f} ms'.format('total', total * 1000))
+
+
+#
+# StackSampler samples the stack of a thread at a fixed interval and counts the collapsed stacks
+#
+class StackSampler:
+
+
+	def __init__(self, threadId, interval):
+		import threading
+
+		self.threadId = threadId
+		self.interval = interval
+		self.stacks = {}
+		self.stopped = threading.Event()
+		self.thread = threading.Thread(target=self.sample, daemon=True)
+		self.switchInterval = None
+
+	def start(self):
+		# The sampled thread only releases the GIL every switch interval (5 ms by default)
+		self.switchInterval = sys.getswitchinterval()
+		sys.setswitchinterval(min(self.switchInterval, self.interval))
+		self.thread.start()
+
+	def stop(self):
+		self.stopped.set()
+		self.thread.join()
+		sys.setswitchinterval(self.switchInterval)
+
+	def sample(self):
+		while not self.stopped.wait(self.interval):
+			frame = sys._current_frames().get(self.threadId)
+			frames = []
+
+			while frame is not None:
+				frames.append('{}:{}'.format(os.path.basename(frame.f_code.co_filename), frame.f_code.co_name))
+				frame = frame.f_back
+
+			if frames:
+				stack = ';'.join(reversed(frames))
+				self.stacks[stack] = self.stacks.get(stack, 0) + 1
+
+	def dump(self, path):
+		with open(path, 'w', encoding='utf-8') as handle:
+			for stack, count in sorted(self.stacks.items()):
+				handle.write('{} {}\n'.format(stack, count))
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+#
+# Table streams rows to a command's output, drawn with the command's box-drawing characters
+#
+# Column widths are either declared or computed from the headers and the first sampleSize rows, never
+# below minWidths: a caller knowing the widest cell of a column up front keeps that column whole.
+# Until the widths are known rows are held back; afterwards each row is written as soon as it is
+# added and nothing is kept, so a table of any length renders in constant memory. Cells wider than
+# their column are truncated with '...'.
+#
+class Table:
+
+	SAMPLE_SIZE = 100
+
+	def __init__(self, command, headers = None, widths = None, sampleSize = None, fgColor = 'reset', bgColor = 'reset', minWidths = None):
+		self.command = command
+		self.chars = command.getArrayChars()
+		self.headers = [self.toCell(header) for header in headers] if headers else None
+		self.widths = list(widths) if widths else None
+		self.minWidths = list(minWidths) if minWidths else []
+		self.sampleSize = sampleSize if sampleSize is not None else self.SAMPLE_SIZE
+		self.fgColor = fgColor
+		self.bgColor = bgColor
+		self.sample = []
+		self.started = False
+		self.separatorPending = False
+
+	def addRow(self, row):
+		row = [self.toCell(cell) for cell in row]
+
+		if self.widths is None:
+			self.sample.append(row)
+
+			if len(self.sample) >= self.sampleSize:
+				self.start()
+
+			return self
+
+		if not self.started:
+			self.start()
+
+		self.writeBodyRow(row)
+
+		return self
+
+	def addRows(self, rows):
+		for row in rows:
+			self.addRow(row)
+
+		return self
+
+	def render(self):
+		if not self.started:
+			self.start()
+
+		self.writeBorder('bottom-left', 'bottom', 'bottom-mid', 'bottom-right')
+		self.command.getOutput().flush()
+
+	def start(self):
+		if self.widths is None:
+			self.widths = self.computeWidths()
+
+		self.started = True
+		self.writeBorder('top-left', 'top', 'top-mid', 'top-right')
+
+		if self.headers:
+			self.writeRow(self.headers)
+			self.separatorPending = True
+
+		for row in self.sample:
+			self.writeBodyRow(row)
+
+		self.sample = []
+		# The first rows are shown right away, the rest follows the output flush policy
+		self.command.getOutput().flush()
+
+	def computeWidths(self):
+		rows = ([self.headers] if self.headers else []) + self.sample
+		columns = max([len(row) for row in rows] + [len(self.minWidths)])
+		widths = self.minWidths + [0] * (columns - len(self.minWidths))
+
+		for row in rows:
+			for i, cell in enumerate(row):
+				if len(cell) > widths[i]:
+					widths[i] = len(cell)
+
+		return widths
+
+	def writeBorder(self, left, fill, junction, right):
+		chars = self.chars
+		line = chars[left] + chars[junction].join(chars[fill] * (width + 2) for width in self.widths) + chars[right]
+		self.command.write(line, self.fgColor, self.bgColor)
+
+	def writeBodyRow(self, row):
+		# Headers are only separated from a body, a header-only table is a simple box
+		if self.separatorPending:
+			self.separatorPending = False
+			self.writeBorder('left-mid', 'mid', 'mid-mid', 'right-mid')
+
+		self.writeRow(row)
+
+	def writeRow(self, row):
+		chars = self.chars
+		cells = []
+
+		for i, width in enumerate(self.widths):
+			cell = row[i] if i < len(row) else ''
+
+			if len(cell) > width:
+				cell = cell[0:width - 3] + '...' if width > 3 else cell[0:width]
+
+			cells.append(' ' + cell.ljust(width) + ' ')
+
+		self.command.write(chars['left'] + chars['middle'].join(cells) + chars['right'], self.fgColor, self.bgColor)
+
+	def toCell(self, value):
+		return str(value).replace('\n', ' ')
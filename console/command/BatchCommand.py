@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+from console.Command import Command
+from console.input.InputArgument import InputArgument
+from console.input.InputOption import InputOption
+
+#
+# BatchCommand runs every command line of a file (or stdin) in the current process
+#
+class BatchCommand(Command):
+
+	def create(self):
+		self.setName('batch')
+		self.setDescription('Run command lines from a file or stdin')
+		self.setDefinition([
+			InputArgument(name='file', mode=InputArgument.OPTIONAL, description='File with one command line per line, - for stdin', default='-'),
+			InputOption(name='--jobs', 				shortcut='-j', mode=InputOption.VALUE_REQUIRED, description='Number of worker processes', default='1'),
+			InputOption(name='--completion-order', 	shortcut=None, mode=InputOption.VALUE_NONE, description='Release the output of each line as soon as it completes')
+		])
+		self.setHelp('> The %command.name% command runs one command line per line, without interaction, in a single process:\n  %command.full_name% commands.txt\n  cat commands.txt | %command.full_name%\n\n  Empty lines and # comments are skipped, each line reports its exit code and duration.\n\n  With --jobs, lines are spread over worker processes and their output is released in submission order:\n  %command.full_name% commands.txt --jobs 8')
+
+	def execute(self, input):
+		jobs = input.getOption('jobs')
+
+		if not str(jobs).isdigit() or int(jobs) < 1:
+			raise ValueError('The --jobs option must be a positive integer.')
+
+		return self.getApplication().runBatch(input.getArgument('file'), int(jobs), not input.getOption('completion-order'), self.getOutput())
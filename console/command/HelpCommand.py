@@ -23,18 +23,36 @@ class HelpCommand(Command):
 		self.setDescription('Displays help for a command')
 		self.setDefinition([InputArgument(name='command_name', mode=InputArgument.OPTIONAL, description='The command name', default='help')])
 		self.setHelp('> The %command.name% command displays help for a given command:\n  %command.full_name% list\n\n  To display the list of available commands, please use the list command.')
+		self.command = None
+		self.commandName = None
 
 	def setCommand(self, command):
 		self.command = command
 
 		return self
 
-	def execute(self, input):
-		if self.command is None:
-			self.command = self.getApplication().find(input.getArgument('command_name'))
+	def setCommandName(self, commandName):
+		self.commandName = commandName
 
+		return self
+
+	def execute(self, input):
 		self.nl()
-		self.write(self.command.getProcessedHelp())
+
+		if self.command is not None:
+			self.write(self.command.getProcessedHelp())
+		else:
+			# Served from the command manifest, the described command is not imported
+			application = self.getApplication()
+			name = application.resolveName(self.commandName or input.getArgument('command_name'))
+			manifest = application.getCommandManifest()
+
+			if not manifest.has(name):
+				raise ValueError(application.getCommandNotFoundMessage(name))
+
+			self.write(Command.processHelp(name, manifest.get(name)['help']))
+
 		self.command = None
+		self.commandName = None
 
 
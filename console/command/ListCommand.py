@@ -9,9 +9,8 @@
  # file that was distributed with this source code.
 ###
 
-from terminaltables import DoubleTable
-
 from console.Command import Command
+from console.Table import Table
 from console.input.InputArgument import InputArgument
 from console.input.InputOption import InputOption
 
@@ -27,38 +26,35 @@ class ListCommand(Command):
 		self.setHelp('> The %command.name% command lists all commands:\n  %command.full_name%')
 
 	def execute(self, input):
-		commands = self.getApplication().getCommands()
-		sortedCommandKeys = sorted(commands)
+		application = self.getApplication()
 
 		self.nl()
 		self.write('Options :')
-		TABLE_DATA = [['Option', 'Description'],]
-		table_instance = DoubleTable(TABLE_DATA)
-		table_instance.justify_columns[2] = 'right'
+		table = Table(self, ['Option', 'Description'])
 
-		for k,option in self.getApplication().getDefaultInputDefinition().getOptions().items():
-			TABLE_DATA.append(['--{} [{}]'.format(option.getName(), option.getShortcut()), option.getDescription()])
+		for k,option in application.getDefaultInputDefinition().getOptions().items():
+			if option.getShortcut():
+				table.addRow(['--{} [{}]'.format(option.getName(), option.getShortcut()), option.getDescription()])
+			else:
+				table.addRow(['--{}'.format(option.getName()), option.getDescription()])
 
-		self.write(table_instance.table)
+		table.render()
 
 		self.nl()
 		self.write('Commands :')
-		TABLE_DATA = [['Command name', 'Description']]
-		table_instance = DoubleTable(TABLE_DATA)
-		table_instance.justify_columns[2] = 'right'
+		manifest = application.getCommandManifest()
+		names = sorted(manifest.getNames())
+		# Names are never truncated, only the descriptions are sampled
+		table = Table(self, ['Command name', 'Description'], sampleSize=1000, minWidths=[max([len(name) for name in names] + [0]), 0])
 
 		limit = 55
 
-		for name in sortedCommandKeys:
-			command = commands[name]
-
-			if len(command.getDescription()) > limit:
-				desc = '{}...'.format(command.getDescription()[0:limit])
-			else:
-				desc = command.getDescription()
-			TABLE_DATA.append([name,desc])
-
-		self.write(table_instance.table)
-
+		# Commands that could not be loaded have no manifest entry
+		for name in names:
+			desc = manifest.get(name)['description']
 
+			if len(desc) > limit:
+				desc = '{}...'.format(desc[0:limit])
+			table.addRow([name,desc])
 
+		table.render()
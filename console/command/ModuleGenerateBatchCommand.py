@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import csv
+import sys
+import json
+import time
+import multiprocessing
+
+from console.Command import Command
+from console.Markup import foreground
+from console.generator import GeneratorWorker
+from console.generator.ModuleArchive import ModuleArchive
+from console.generator.ModuleGenerator import ModuleGenerator
+from console.input.InputArgument import InputArgument
+from console.input.InputOption import InputOption
+
+#
+# ModuleGenerateBatchCommand generates every module described by a JSON lines or CSV spec, over worker processes
+#
+class ModuleGenerateBatchCommand(Command):
+
+	FORMATS = ['jsonl', 'csv']
+
+	def create(self):
+		self.setName('module:generate-batch')
+		self.setDescription('Generate Alice modules from a JSON lines or CSV spec')
+		self.setDefinition([
+			InputArgument(name='spec', mode=InputArgument.OPTIONAL, description='Spec file, - for stdin', default='-'),
+			InputOption(name='--format', 	shortcut='-f', mode=InputOption.VALUE_REQUIRED, description='Spec format, guessed from the file extension', choices=self.FORMATS),
+			InputOption(name='--output', 	shortcut='-o', mode=InputOption.VALUE_REQUIRED, description='Directory the modules are generated in', default='.'),
+			InputOption(name='--archive', 	shortcut='-a', mode=InputOption.VALUE_REQUIRED, description='Pack all the modules into a .zip, .tar or .tar.gz archive instead'),
+			InputOption(name='--jobs', 		shortcut='-j', mode=InputOption.VALUE_REQUIRED, description='Number of worker processes, all CPUs by default')
+		])
+		self.setHelp('> The %command.name% command generates one module per row of a spec, rows have githubUsername, moduleName,\n'
+			'  moduleDescription and languages (comma separated or a JSON list) fields:\n'
+			'  %command.full_name% modules.jsonl --output modules\n'
+			'  %command.full_name% modules.csv --jobs 4\n'
+			'  %command.full_name% modules.jsonl --archive modules.tar.gz\n\n'
+			'  Rows are validated like module:generate, a failing row is reported and the batch goes on.')
+
+	def execute(self, input):
+		jobs = input.getOption('jobs') or str(os.cpu_count() or 1)
+
+		if not str(jobs).isdigit() or int(jobs) < 1:
+			raise ValueError('The --jobs option must be a positive integer.')
+
+		spec = input.getArgument('spec')
+		format = input.getOption('format') or ('csv' if spec.endswith('.csv') else 'jsonl')
+
+		if format not in self.FORMATS:
+			raise ValueError('The --format option must be one of {}.'.format(', '.join(self.FORMATS)))
+
+		if spec == '-':
+			rows = self.readRows(sys.stdin, format)
+		else:
+			with open(spec, 'r', encoding='utf-8', newline='') as handle:
+				rows = self.readRows(handle, format)
+
+		output = input.getOption('output')
+		batchJobs = [(index, row, output) for index, (row, error) in enumerate(rows, 1) if error is None]
+		generator = ModuleGenerator()
+		generator.getTemplates()
+		GeneratorWorker.setGenerator(generator)
+
+		start = time.perf_counter()
+		failed = 0
+		archive = ModuleArchive(input.getOption('archive')) if input.getOption('archive') else None
+
+		for index, (row, error) in enumerate(rows, 1):
+			if error is not None:
+				failed += 1
+				self.getOutput().writeln(foreground('red') + '[Generate]' + foreground('reset') + ' Row {} failed : {}'.format(index, error))
+
+		try:
+			for index, name, result, error, duration in self.generate(batchJobs, int(jobs), GeneratorWorker.generateModule if archive is None else GeneratorWorker.renderModule):
+				destination = result
+
+				if error is None and archive is not None:
+					# Workers return the rendered files, they are packed here into the single archive
+					try:
+						archive.addModule(name, result)
+						destination = '{} ({}/)'.format(archive.path, name)
+					except ValueError as e:
+						error = str(e)
+
+				if error is None:
+					self.getOutput().writeln(foreground('green') + '[Generate]' + foreground('reset') + ' Row {} {} generated in {:.3f} ms : {}'.format(index, name, duration, destination))
+				else:
+					failed += 1
+					self.getOutput().writeln(foreground('red') + '[Generate]' + foreground('reset') + ' Row {} {} failed in {:.3f} ms : {}'.format(index, name, duration, error))
+		except BaseException:
+			if archive is not None:
+				archive.discard()
+
+			raise
+
+		if archive is not None:
+			archive.close()
+
+		self.getOutput().writeln('[Generate] {} module(s) in {:.3f} ms, {} failed'.format(len(rows), (time.perf_counter() - start) * 1000, failed))
+
+		return 1 if failed else 0
+
+	@staticmethod
+	def readRows(handle, format):
+		# Rows come with their parse error, a malformed line fails on its own and the batch goes on
+		if format == 'csv':
+			return [(row, None) for row in csv.DictReader(handle)]
+
+		rows = []
+
+		for lineNumber, line in enumerate(handle, 1):
+			if not line.strip():
+				continue
+
+			try:
+				row = json.loads(line)
+			except ValueError as e:
+				rows.append((None, 'Line {} of the spec is not valid JSON: {}'.format(lineNumber, str(e))))
+				continue
+
+			if type(row) is not dict:
+				rows.append((None, 'Line {} of the spec is not a JSON object.'.format(lineNumber)))
+				continue
+
+			rows.append((row, None))
+
+		return rows
+
+	@staticmethod
+	def generate(batchJobs, jobs, worker = GeneratorWorker.generateModule):
+		if jobs == 1 or len(batchJobs) <= 1:
+			for job in batchJobs:
+				yield worker(job)
+
+			return
+
+		# Workers are forked once the templates are compiled, results come back as they complete
+		with multiprocessing.get_context('fork').Pool(min(jobs, len(batchJobs))) as pool:
+			for result in pool.imap_unordered(worker, batchJobs, chunksize=max(1, len(batchJobs) // (jobs * 8))):
+				yield result
@@ -9,11 +9,14 @@
  # file that was distributed with this source code.
 ###
 
+import os
 import sys
-import re
-from terminaltables import AsciiTable, DoubleTable
-
+import time
+import asyncio
 from console.Command import Command
+from console.Table import Table
+from console.generator.ModuleArchive import ModuleArchive
+from console.generator.ModuleGenerator import ModuleGenerator
 from console.input.InputArgument import InputArgument
 from console.input.InputOption import InputOption
 
@@ -38,74 +41,129 @@ class ModuleGenerateCommand(Command):
 		self.setDefinition([
 			InputOption(name='--githubUsername', 	shortcut='-u', mode=InputOption.VALUE_REQUIRED, description='Your GitHub username'),
 			InputOption(name='--moduleName', 		shortcut='-m', mode=InputOption.VALUE_REQUIRED, description='Name for the module you\'re creating'),
-			InputOption(name='--moduleDescription', shortcut='-d', mode=InputOption.VALUE_REQUIRED, description='Description for that module')
+			InputOption(name='--moduleDescription', shortcut='-d', mode=InputOption.VALUE_REQUIRED, description='Description for that module'),
+			InputOption(name='--languages', 		shortcut='-l', mode=InputOption.VALUE_REQUIRED, description='Comma separated languages of the module', default='en'),
+			InputOption(name='--output', 			shortcut='-o', mode=InputOption.VALUE_REQUIRED, description='Directory the module is generated in', default='.'),
+			InputOption(name='--archive', 		shortcut='-a', mode=InputOption.VALUE_REQUIRED, description='Pack the module into a .zip, .tar or .tar.gz archive instead'),
+			InputOption(name='--dry-run', 			shortcut=None, mode=InputOption.VALUE_NONE, description='Report the files that would change without writing them')
 		])
-		self.setHelp('<fg:yellow> - The command %command.name% generates an empty module based on a hardcoded template.<fg:reset>\n '
-			 ' Example:\n\t%command.full_name% --githubUsername="jr-k" --moduleName="Timer" -d "Alice sets a timer with customizable duration"\n\n'
+		self.setHelp('<fg:yellow> - The command %command.name% generates an empty module from the templates of console/generator/templates/module.<fg:reset>\n '
+			 ' Example:\n\t%command.full_name% --githubUsername="jr-k" --moduleName="Timer" -d "Alice sets a timer with customizable duration" -l en,fr\n\n'
+			 ' Running it again on an existing module only rewrites the files whose content changed, files edited by hand are kept.\n'
+			 ' With --archive out.zip (or .tar, .tar.gz) the module is packed into the archive instead, no file is written.\n\n'
 		)
+		self.generator = ModuleGenerator()
 
-	def interact(self, input):
-		TABLE_DATA = [['Alice Module Generator']]
-		table_instance = DoubleTable(TABLE_DATA)
-		table_instance.justify_columns[2] = 'right'
-		self.write('\n' + table_instance.table + '\n', 'yellow')
+	@staticmethod
+	def scanModules(path):
+		modules = set()
 
-		self.write("""Welcome in this basic module generator tool. All modules shared by the official Project Alice repository must have english!
-You can now start creating your module. Remember to edit the dialogTemplate/en.json and remove dummy data!""")
+		if not os.path.isdir(path):
+			return modules
 
-		fields = []
-		fieldTypeAvailable = ['en', 'fr', 'de', 'it', 'es', 'ru', 'jp', 'kr']
-		_loop = True
+		for entry in os.scandir(path):
+			if entry.is_dir() and os.path.isdir(os.path.join(entry.path, 'dialogTemplate')):
+				modules.add(entry.name)
 
-		while _loop:
-			entity = self.ask('\nEntity name : ', fgColor='yellow')
+		return modules
 
-			if entity == 'exit' or entity == 'quit' or entity == '!q':
-				_loop = False
-				sys.exit(0)
-			_loop = False
+	async def interact(self, input):
+		# Existing modules are scanned while the questions are answered
+		modules = asyncio.ensure_future(self.runBlocking(self.scanModules, input.getOption('output')))
 
+		self.nl()
+		Table(self, ['Alice Module Generator'], fgColor='yellow').render()
+		self.nl()
 
-		fieldList = ''
+		self.write("""Welcome in this basic module generator tool. All modules shared by the official Project Alice repository must have english!
+You can now start creating your module. Remember to edit the dialogTemplate/en.json and remove dummy data!
+Answer exit, quit or !q to leave.""")
 
-		for fieldItem in fieldTypeAvailable:
-			fieldList += fieldItem + ', '
+		# Only the options missing from the command line are asked for
+		if not input.getOption('moduleName'):
+			input.setOption('moduleName', await self.askValid('\nModule name : ', lambda answer: ModuleGenerator.getClassName(answer) and answer))
 
-		fieldList = fieldList[0:len(fieldList)- 1]
+		if not input.getOption('githubUsername'):
+			input.setOption('githubUsername', await self.askValid('\nYour GitHub username : ', ModuleGenerator.checkUsername))
 
-		TABLE_DATA = [['Available languages']]
-		table_instance = AsciiTable(TABLE_DATA)
-		table_instance.justify_columns[2] = 'right'
-		self.write('\n' + table_instance.table + '\n', 'yellow')
+		if input.getOption('moduleDescription') is None:
+			input.setOption('moduleDescription', await self.askValid('\nModule description : ', lambda answer: answer))
 
-		self.write(fieldList)
+		if not input.hasParameterOption(['--languages', '-l']):
+			languages = ['en']
 
-		while True:
-			field = self.ask('\nNew language name (press <return> to stop adding fields): ', fgColor='yellow')
-
-			reg = re.compile(r'^([a-zA-Z0-9_]+)$')
-			match = reg.match(field)
-
-			if len(field) == 0:
-				break
-			elif match.group(0) == None or len(match.group(0)) <= 0:
-				self.write('  The language name contains invalid characters.')
-				continue
-			else:
-				while True:
-					type = self.askCombo('Dummy type <fg:reset>[en]<fg:yellow>: ', 'en', fieldTypeAvailable, fgColor='yellow')
-					fields.append({"name": field, "type": type})
+			self.nl()
+			Table(self, ['Available languages'], fgColor='yellow').render()
+			self.nl()
+
+			self.write(', '.join(ModuleGenerator.LANGUAGES))
+
+			while True:
+				language = await self.askValid('\nNew language, english is always included (press <return> to stop adding languages): ', lambda answer: ModuleGenerator.checkLanguage(answer) if answer else answer)
+
+				if not language:
 					break
 
+				if language not in languages:
+					languages.append(language)
+
+			input.setOption('languages', ','.join(languages))
 
-		print(fields)
+		if ModuleGenerator.getClassName(input.getOption('moduleName')) in await modules:
+			self.write('  A module named {} already exists here, only the files that changed are written.'.format(ModuleGenerator.getClassName(input.getOption('moduleName'))), fgColor='yellow')
 
 		return 0
 
+	async def askValid(self, question, check):
+		# Asked again until check accepts the answer, check raises ValueError with the reason
+		while True:
+			answer = (await self.askAsync(question, fgColor='yellow')).strip()
+
+			if answer in ['exit', 'quit', '!q']:
+				sys.exit(0)
+
+			try:
+				return check(answer)
+			except ValueError as e:
+				self.write('  ' + str(e))
 
 	def execute(self, input):
-		print(input.getOption("githubUsername"))
-		print(input.getOption("moduleName"))
-		print(input.getOption("moduleDescription"))
-		self.nl()
-		sys.exit(0)
\ No newline at end of file
+		context = ModuleGenerator.buildContext(input.getOption('moduleName'), input.getOption('githubUsername'), input.getOption('moduleDescription'), input.getOption('languages'))
+		dryRun = input.getOption('dry-run')
+		start = time.perf_counter()
+
+		if input.getOption('archive'):
+			if dryRun:
+				raise ValueError('The --dry-run option cannot be used with --archive.')
+
+			archive = ModuleArchive(input.getOption('archive'))
+
+			try:
+				archive.addModule(context['moduleName'], self.generator.render(context, context['languages']))
+			except BaseException:
+				archive.discard()
+				raise
+
+			self.write('Module <fg:green>{}<fg:reset> packed in {} ({:.3f} ms)'.format(context['moduleName'], archive.close(), (time.perf_counter() - start) * 1000))
+
+			return 0
+
+		destination, changes = self.generator.generate(context, context['languages'], os.path.join(input.getOption('output'), context['moduleName']), dryRun)
+		duration = (time.perf_counter() - start) * 1000
+		counts = {}
+		colors = {ModuleGenerator.CREATED: 'green', ModuleGenerator.UPDATED: 'yellow', ModuleGenerator.REMOVED: 'red', ModuleGenerator.KEPT: 'cyan'}
+
+		for status, path in changes:
+			counts[status] = counts.get(status, 0) + 1
+
+			if status != ModuleGenerator.UNCHANGED:
+				self.write('  <fg:{}>{:<9}<fg:reset> {}'.format(colors[status], status, path))
+
+		summary = ', '.join('{} {}'.format(counts[status], status) for status in [ModuleGenerator.CREATED, ModuleGenerator.UPDATED, ModuleGenerator.UNCHANGED, ModuleGenerator.REMOVED, ModuleGenerator.KEPT] if status in counts)
+
+		if dryRun:
+			self.write('Module <fg:green>{}<fg:reset> would be generated in {}: {} ({:.3f} ms)'.format(context['moduleName'], destination, summary or 'nothing to do', duration))
+		else:
+			self.write('Module <fg:green>{}<fg:reset> generated in {}: {} ({:.3f} ms)'.format(context['moduleName'], destination, summary or 'nothing to do', duration))
+
+		return 0
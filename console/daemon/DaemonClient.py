@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import sys
+import json
+import stat
+import socket
+import struct
+
+#
+# DaemonClient forwards a command line to a running DaemonServer
+#
+# The client only relies on the standard library so it starts as fast as the interpreter does.
+# argv, environment and working directory are sent as a JSON header, stdin/stdout/stderr are passed
+# as file descriptors over the Unix socket and the exit code of the command is read back.
+# When no daemon is listening, the command is run in-process instead.
+#
+# The socket lives in a private directory (owned by the user, mode 0700, never a shared /tmp) and both
+# ends check the uid of their peer before anything is sent: the client hands over its environment
+# and its terminal, they must only reach a daemon of the same user.
+#
+class DaemonClient:
+
+	HEADER = struct.Struct('!I')
+
+	CREDENTIALS = struct.Struct('3i')
+
+	def __init__(self, socketPath = None):
+		self.socketPath = socketPath or DaemonClient.getDefaultSocketPath()
+
+	@staticmethod
+	def getDefaultSocketPath():
+		if os.environ.get('ALICECONSOLE_SOCKET'):
+			return os.environ['ALICECONSOLE_SOCKET']
+
+		runtimeDir = os.environ.get('XDG_RUNTIME_DIR') or os.environ.get('TMPDIR') or '/tmp'
+
+		return os.path.join(runtimeDir, 'aliceconsole-{}'.format(os.getuid()), 'daemon.sock')
+
+	@staticmethod
+	def checkSocketDir(socketPath, create = False):
+		directory = os.path.dirname(os.path.abspath(socketPath))
+
+		if create:
+			try:
+				os.mkdir(directory, 0o700)
+			except FileExistsError:
+				pass
+
+		info = os.lstat(directory)
+
+		if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+			raise PermissionError('The daemon socket directory {} must be a directory of your own with mode 0700.'.format(directory))
+
+		return directory
+
+	@staticmethod
+	def getPeerUid(connection):
+		# Linux only, elsewhere the private directory is the only guard
+		if not hasattr(socket, 'SO_PEERCRED'):
+			return None
+
+		return DaemonClient.CREDENTIALS.unpack(connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, DaemonClient.CREDENTIALS.size))[1]
+
+	@staticmethod
+	def checkPeer(connection):
+		uid = DaemonClient.getPeerUid(connection)
+
+		if uid is not None and uid != os.getuid():
+			raise PermissionError('The daemon socket peer runs as uid {}, not as uid {}.'.format(uid, os.getuid()))
+
+	def run(self, argv):
+		try:
+			connection = self.connect()
+		except PermissionError as e:
+			sys.stderr.write('[Daemon] {} The command runs without the daemon.\n'.format(str(e)))
+
+			return self.runLocally(argv)
+		except OSError:
+			return self.runLocally(argv)
+
+		with connection:
+			payload = json.dumps({'argv': argv, 'env': dict(os.environ), 'cwd': os.getcwd()}).encode('utf-8')
+			sys.stdout.flush()
+			sys.stderr.flush()
+			socket.send_fds(connection, [DaemonClient.HEADER.pack(len(payload))], [0, 1, 2])
+			connection.sendall(payload)
+
+			return DaemonClient.HEADER.unpack(DaemonClient.receive(connection, DaemonClient.HEADER.size))[0]
+
+	def connect(self):
+		self.checkSocketDir(self.socketPath)
+		connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+		try:
+			connection.connect(self.socketPath)
+			self.checkPeer(connection)
+		except OSError:
+			connection.close()
+			raise
+
+		return connection
+
+	def runLocally(self, argv):
+		from console.Application import Application
+		from console.input.ArgvInput import ArgvInput
+
+		exitCode = Application().run(ArgvInput(argv))
+
+		return exitCode if isinstance(exitCode, int) else 0
+
+	@staticmethod
+	def receive(connection, size):
+		data = b''
+
+		while len(data) < size:
+			chunk = connection.recv(size - len(data))
+
+			if not chunk:
+				raise ConnectionError('The daemon closed the connection before answering.')
+
+			data += chunk
+
+		return data
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import sys
+import json
+import signal
+import socket
+
+from console.daemon.DaemonClient import DaemonClient
+from console.input.ArgvInput import ArgvInput
+
+#
+# DaemonServer keeps a warm Application listening on a Unix socket
+#
+# Every command is imported once at startup, then each connection is served by a forked child which
+# inherits the warm interpreter, adopts the client's stdio, environment and working directory,
+# runs the command line and sends the exit code back.
+#
+class DaemonServer:
+
+
+	def __init__(self, application, socketPath = None):
+		self.application = application
+		self.socketPath = socketPath or DaemonClient.getDefaultSocketPath()
+		self.server = None
+
+	def getSocketPath(self):
+		return self.socketPath
+
+	def serve(self):
+		self.application.setAutoExit(False)
+		self.application.warmUp()
+		# Children are forked long after the daemon started, their profile starts with the request
+		self.application.resetStartupPhases()
+		self.listen()
+
+		signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+		signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+		try:
+			while True:
+				connection, _ = self.server.accept()
+
+				try:
+					DaemonClient.checkPeer(connection)
+				except OSError:
+					# Nothing is read from another user's process
+					connection.close()
+					continue
+
+				pid = os.fork()
+
+				if pid == 0:
+					# Whatever happens the child never returns into this loop, its finally would remove the socket
+					exitCode = 1
+
+					try:
+						self.server.close()
+						exitCode = self.handle(connection)
+					finally:
+						os._exit(exitCode)
+
+				connection.close()
+		except KeyboardInterrupt:
+			pass
+		finally:
+			self.close()
+
+	def listen(self):
+		DaemonClient.checkSocketDir(self.socketPath, True)
+
+		if os.path.exists(self.socketPath):
+			try:
+				DaemonClient(self.socketPath).connect().close()
+			except OSError:
+				os.remove(self.socketPath)
+			else:
+				raise ValueError('A daemon is already listening on {}.'.format(str(self.socketPath)))
+
+		self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+		# The socket is created private, there is no window before a chmod
+		umask = os.umask(0o177)
+
+		try:
+			self.server.bind(self.socketPath)
+		finally:
+			os.umask(umask)
+
+		self.server.listen()
+
+	def close(self):
+		if self.server is not None:
+			self.server.close()
+			self.server = None
+
+		if os.path.exists(self.socketPath):
+			os.remove(self.socketPath)
+
+	def handle(self, connection):
+		signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+		signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+		try:
+			request, fds = self.receive(connection)
+
+			for target, fd in enumerate(fds):
+				os.dup2(fd, target)
+				os.close(fd)
+
+			os.chdir(request['cwd'])
+			os.environ.clear()
+			os.environ.update(request['env'])
+			sys.argv = [sys.argv[0]] + request['argv']
+
+			exitCode = self.dispatch(request['argv'])
+		except Exception:
+			exitCode = 1
+
+		try:
+			sys.stdout.flush()
+			sys.stderr.flush()
+			connection.sendall(DaemonClient.HEADER.pack(exitCode))
+		except OSError:
+			pass
+
+		return 0
+
+	def dispatch(self, argv):
+		try:
+			exitCode = self.application.run(ArgvInput(argv))
+		except SystemExit as e:
+			exitCode = e.code
+
+		if exitCode is None:
+			return 0
+
+		# Truncated to a byte like a process exit status, the header is unsigned
+		return exitCode & 0xFF if isinstance(exitCode, int) else 1
+
+	def receive(self, connection):
+		header, fds, _, _ = socket.recv_fds(connection, DaemonClient.HEADER.size, 3)
+
+		if len(header) < DaemonClient.HEADER.size:
+			header += DaemonClient.receive(connection, DaemonClient.HEADER.size - len(header))
+
+		size = DaemonClient.HEADER.unpack(header)[0]
+
+		return json.loads(DaemonClient.receive(connection, size).decode('utf-8')), fds
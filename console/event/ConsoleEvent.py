@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import time
+
+#
+# ConsoleEvent is what the EventDispatcher hands to the listeners
+#
+# command.terminate carries the exit code and the duration, command.error the error and its exit code,
+# output.flushed the number of characters flushed. The command is None for errors raised before one was found.
+#
+class ConsoleEvent:
+
+	COMMAND_START = 'command.start'
+	COMMAND_TERMINATE = 'command.terminate'
+	COMMAND_ERROR = 'command.error'
+	INPUT_BOUND = 'input.bound'
+	OUTPUT_FLUSHED = 'output.flushed'
+
+	def __init__(self, command = None, input = None, output = None):
+		self.name = None
+		self.command = command
+		self.input = input
+		self.output = output
+		self.exitCode = None
+		self.duration = None
+		self.error = None
+		self.size = None
+		self.time = time.time()
+
+	def getName(self):
+		return self.name
+
+	def setName(self, name):
+		self.name = name
+
+		return self
+
+	def getCommand(self):
+		return self.command
+
+	def getCommandName(self):
+		return self.command.getName() if self.command is not None else None
+
+	def getInput(self):
+		return self.input
+
+	def getOutput(self):
+		return self.output
+
+	def getExitCode(self):
+		return self.exitCode
+
+	def setExitCode(self, exitCode):
+		self.exitCode = exitCode
+
+		return self
+
+	def getDuration(self):
+		return self.duration
+
+	def setDuration(self, duration):
+		self.duration = duration
+
+		return self
+
+	def getError(self):
+		return self.error
+
+	def setError(self, error):
+		self.error = error
+
+		return self
+
+	def getSize(self):
+		return self.size
+
+	def setSize(self, size):
+		self.size = size
+
+		return self
+
+	def getTime(self):
+		return self.time
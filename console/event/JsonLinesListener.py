@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import json
+
+from console.event.ConsoleEvent import ConsoleEvent
+
+#
+# JsonLinesListener appends one JSON object per event to a file
+#
+# Each line is written with a single append, so concurrent runs (cron, batch workers) do not interleave.
+#
+class JsonLinesListener:
+
+	EVENTS = [ConsoleEvent.COMMAND_TERMINATE, ConsoleEvent.COMMAND_ERROR]
+
+	def __init__(self, path, events = None):
+		self.path = path
+		self.events = events if events is not None else self.EVENTS
+
+	def subscribe(self, dispatcher):
+		for eventName in self.events:
+			dispatcher.addListener(eventName, self.onEvent)
+
+		return self
+
+	def onEvent(self, event):
+		record = {
+			'event': event.getName(),
+			'time': event.getTime(),
+			'pid': os.getpid(),
+			'command': event.getCommandName(),
+			'exitCode': event.getExitCode(),
+			'duration': event.getDuration(),
+			'error': str(event.getError()) if event.getError() is not None else None
+		}
+
+		if event.getSize() is not None:
+			record['size'] = event.getSize()
+
+		with open(self.path, 'a', encoding='utf-8') as handle:
+			handle.write(json.dumps(record) + '\n')
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import logging
+
+from console.event.ConsoleEvent import ConsoleEvent
+
+try:
+	import fcntl
+except ImportError:
+	fcntl = None
+
+#
+# PrometheusListener keeps a file for the node_exporter textfile collector up to date
+#
+# Every run reads the previous samples back, updates the counters and gauges of its command and
+# replaces the file atomically, so totals accumulate across cron runs. A lock file serializes runs.
+# The file is written once per command, when it terminates; errors raised before any command ran
+# have no terminate event and are written on their own.
+#
+class PrometheusListener:
+
+	METRICS = [
+		('command_runs_total', 'counter', 'Commands run, by exit code.'),
+		('command_errors_total', 'counter', 'Commands that raised an error.'),
+		('command_duration_seconds', 'summary', 'Time spent running commands.'),
+		('command_last_duration_seconds', 'gauge', 'Duration of the last run.'),
+		('command_last_exit_code', 'gauge', 'Exit code of the last run.'),
+		('command_last_run_timestamp_seconds', 'gauge', 'End of the last run.')
+	]
+
+	logger = logging.getLogger(__name__)
+
+	def __init__(self, path, prefix = 'aliceconsole'):
+		self.path = path
+		self.prefix = prefix
+
+	def subscribe(self, dispatcher):
+		dispatcher.addListener(ConsoleEvent.COMMAND_TERMINATE, self.onTerminate)
+		dispatcher.addListener(ConsoleEvent.COMMAND_ERROR, self.onError)
+
+		return self
+
+	def onTerminate(self, event):
+		command = self.escape(event.getCommandName())
+		labels = 'command="{}"'.format(command)
+
+		def update(samples):
+			key = 'command_runs_total{{command="{}",exit_code="{}"}}'.format(command, event.getExitCode())
+			samples[key] = samples.get(key, 0) + 1
+			samples['command_duration_seconds_sum{' + labels + '}'] = samples.get('command_duration_seconds_sum{' + labels + '}', 0) + event.getDuration()
+			samples['command_duration_seconds_count{' + labels + '}'] = samples.get('command_duration_seconds_count{' + labels + '}', 0) + 1
+			samples['command_last_duration_seconds{' + labels + '}'] = event.getDuration()
+			samples['command_last_exit_code{' + labels + '}'] = event.getExitCode()
+			samples['command_last_run_timestamp_seconds{' + labels + '}'] = event.getTime() + event.getDuration()
+
+			if event.getError() is not None:
+				samples['command_errors_total{' + labels + '}'] = samples.get('command_errors_total{' + labels + '}', 0) + 1
+
+		self.update(update)
+
+	def onError(self, event):
+		# The error of a running command is counted by onTerminate
+		if event.getCommand() is not None:
+			return
+
+		key = 'command_errors_total{{command="{}"}}'.format(self.escape(event.getCommandName()))
+
+		def update(samples):
+			samples[key] = samples.get(key, 0) + 1
+
+		self.update(update)
+
+	@staticmethod
+	def escape(value):
+		if value is None:
+			return ''
+
+		return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+	def update(self, callback):
+		with open(self.path + '.lock', 'a') as lock:
+			if fcntl is not None:
+				fcntl.flock(lock, fcntl.LOCK_EX)
+
+			samples = self.load()
+			callback(samples)
+			self.save(samples)
+
+	def load(self):
+		samples = {}
+		prefix = self.prefix + '_'
+
+		try:
+			with open(self.path, 'r', encoding='utf-8') as handle:
+				for lineNumber, line in enumerate(handle, 1):
+					if not line.startswith(prefix):
+						continue
+
+					try:
+						key, value = line.rstrip('\n').rsplit(' ', 1)
+						samples[key[len(prefix):]] = float(value)
+					except ValueError:
+						self.logger.warning('Line %d of %s is not a valid sample, it is dropped: %s', lineNumber, self.path, line.rstrip('\n'))
+		except FileNotFoundError:
+			return {}
+		except (OSError, ValueError) as e:
+			self.logger.warning('Could not read the samples of %s, counters start over: %s', self.path, e)
+
+			return {}
+
+		return samples
+
+	def save(self, samples):
+		lines = []
+
+		for name, type, help in self.METRICS:
+			names = [name, name + '_sum', name + '_count'] if type == 'summary' else [name]
+			keys = sorted(key for key in samples if key.split('{', 1)[0] in names)
+
+			if not keys:
+				continue
+
+			lines.append('# HELP {}_{} {}'.format(self.prefix, name, help))
+			lines.append('# TYPE {}_{} {}'.format(self.prefix, name, type))
+
+			for key in keys:
+				lines.append('{}_{} {}'.format(self.prefix, key, repr(float(samples[key]))))
+
+		tmpPath = '{}.{}.tmp'.format(self.path, os.getpid())
+
+		with open(tmpPath, 'w', encoding='utf-8') as handle:
+			handle.write('\n'.join(lines) + '\n')
+
+		os.replace(tmpPath, self.path)
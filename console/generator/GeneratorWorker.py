@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import time
+
+from console.generator.ModuleGenerator import ModuleGenerator
+
+#
+# GeneratorWorker generates the modules of a module:generate-batch, inline or inside pool workers
+#
+# The generator is set by the parent before the pool is forked, its templates are compiled once there.
+# A failing row is reported with its error instead of stopping the batch. When the batch is packed into an
+# archive, workers only render the modules and the parent streams the files into the archive.
+#
+
+generator = None
+
+def setGenerator(instance):
+	global generator
+	generator = instance
+
+def formatError(e):
+	if isinstance(e, (ValueError, OSError)):
+		return str(e)
+
+	return '{}: {}'.format(e.__class__.__name__, str(e))
+
+def generateModule(job):
+	index, row, output = job
+	start = time.perf_counter()
+
+	try:
+		context = ModuleGenerator.buildContext(row.get('moduleName'), row.get('githubUsername'), row.get('moduleDescription'), row.get('languages') or 'en')
+		destination, changes = generator.generate(context, context['languages'], os.path.join(output, context['moduleName']))
+
+		return (index, context['moduleName'], destination, None, (time.perf_counter() - start) * 1000)
+	except Exception as e:
+		# Anything a row can raise, like a spec field of the wrong type, fails that row only
+		return (index, row.get('moduleName'), None, formatError(e), (time.perf_counter() - start) * 1000)
+
+def renderModule(job):
+	index, row, output = job
+	start = time.perf_counter()
+
+	try:
+		context = ModuleGenerator.buildContext(row.get('moduleName'), row.get('githubUsername'), row.get('moduleDescription'), row.get('languages') or 'en')
+
+		return (index, context['moduleName'], generator.render(context, context['languages']), None, (time.perf_counter() - start) * 1000)
+	except Exception as e:
+		return (index, row.get('moduleName'), None, formatError(e), (time.perf_counter() - start) * 1000)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import io
+import os
+import time
+import tarfile
+import zipfile
+
+#
+# ModuleArchive packs rendered modules into a single zip or tar archive, the format follows the file extension
+#
+# Rendered files are streamed into the archive from memory, each module under a directory named after it,
+# nothing is written to disk but the archive itself. An archive left incomplete by an error is discarded.
+#
+class ModuleArchive:
+
+	FORMATS = [('.zip', None), ('.tar.gz', 'w:gz'), ('.tgz', 'w:gz'), ('.tar', 'w')]
+
+	FILE_MODE = 0o644
+
+	# zlib default, gzip defaults to 9 which costs much more for little gain on small text files
+	COMPRESS_LEVEL = 6
+
+	def __init__(self, path):
+		self.path = os.path.abspath(path)
+		self.modules = set()
+		self.mtime = time.time()
+		self.mode = None
+
+		for suffix, mode in self.FORMATS:
+			if path.endswith(suffix):
+				self.mode = mode or 'zip'
+				break
+
+		if self.mode is None:
+			raise ValueError('The archive {} must end with one of {}.'.format(path, ', '.join(suffix for suffix, mode in self.FORMATS)))
+
+		os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+		if self.mode == 'zip':
+			self.archive = zipfile.ZipFile(self.path, 'w', zipfile.ZIP_DEFLATED)
+		elif self.mode == 'w:gz':
+			self.archive = tarfile.open(self.path, self.mode, compresslevel=self.COMPRESS_LEVEL)
+		else:
+			self.archive = tarfile.open(self.path, self.mode)
+
+	def addModule(self, moduleName, files):
+		if moduleName in self.modules:
+			raise ValueError('The module {} is already in the archive {}.'.format(moduleName, self.path))
+
+		self.modules.add(moduleName)
+
+		for path, content in sorted(files.items()):
+			self.addFile('{}/{}'.format(moduleName, path), content.encode('utf-8'))
+
+		return self
+
+	def addFile(self, name, data):
+		if self.mode == 'zip':
+			info = zipfile.ZipInfo(name, time.localtime(self.mtime)[:6])
+			info.compress_type = zipfile.ZIP_DEFLATED
+			info.external_attr = (0o100000 | self.FILE_MODE) << 16
+			self.archive.writestr(info, data)
+		else:
+			info = tarfile.TarInfo(name)
+			info.size = len(data)
+			info.mtime = self.mtime
+			info.mode = self.FILE_MODE
+			self.archive.addfile(info, io.BytesIO(data))
+
+	def close(self):
+		self.archive.close()
+
+		return self.path
+
+	def discard(self):
+		try:
+			self.archive.close()
+		finally:
+			if os.path.exists(self.path):
+				os.unlink(self.path)
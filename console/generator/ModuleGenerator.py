@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import re
+import json
+import shutil
+import keyword
+import hashlib
+import tempfile
+
+from console.Tools import camelCase
+from console.generator.Template import Template
+
+#
+# ModuleGenerator renders an Alice module skeleton from a template directory and writes it atomically
+#
+# Every file of the template directory ending with .tpl is a template, its path too: the .tpl suffix is
+# dropped and placeholders are rendered, a file whose path uses {{ language }} is rendered once per language.
+# The whole tree is rendered in memory, written to a temporary directory next to the destination and
+# renamed into place, so a module directory is either complete or absent.
+#
+# The hash of every generated file is kept in a manifest inside the module. Generating into an existing module
+# only writes the files whose content changed and removes the ones no template renders anymore, files edited
+# since they were generated are kept. A file is rendered again only when its template or the values it uses
+# changed, the manifest doubles as a render cache keyed by the template hashes and the input values.
+#
+class ModuleGenerator:
+
+	SUFFIX = '.tpl'
+
+	LANGUAGES = ['en', 'fr', 'de', 'it', 'es', 'ru', 'jp', 'kr']
+
+	MANIFEST = '.module-manifest.json'
+
+	MANIFEST_VERSION = 1
+
+	CREATED = 'created'
+
+	UPDATED = 'updated'
+
+	UNCHANGED = 'unchanged'
+
+	REMOVED = 'removed'
+
+	KEPT = 'kept'
+
+	REGEX_USERNAME = re.compile(r'^[a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38}$')
+
+	def __init__(self, templateDir = None):
+		if templateDir is None:
+			templateDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates', 'module')
+
+		self.templateDir = templateDir
+		self.templates = None
+
+	@classmethod
+	def getClassName(cls, moduleName):
+		if not moduleName or not camelCase(moduleName):
+			raise ValueError('A module name is required.')
+
+		# The name is the class name of the module
+		className = camelCase(moduleName, True)
+
+		if not className.isidentifier() or keyword.iskeyword(className):
+			raise ValueError('\'{}\' is not a valid module name, it must give a Python class name.'.format(str(moduleName)))
+
+		return className
+
+	@classmethod
+	def checkUsername(cls, githubUsername):
+		if not githubUsername or not cls.REGEX_USERNAME.match(githubUsername):
+			raise ValueError('\'{}\' is not a valid GitHub username.'.format(str(githubUsername)))
+
+		return githubUsername
+
+	@classmethod
+	def checkLanguage(cls, language):
+		if language not in cls.LANGUAGES:
+			raise ValueError('Language \'{}\' is not supported, use one of {}.'.format(language, ', '.join(cls.LANGUAGES)))
+
+		return language
+
+	@classmethod
+	def buildContext(cls, moduleName, githubUsername, moduleDescription, languages):
+		className = cls.getClassName(moduleName)
+		cls.checkUsername(githubUsername)
+
+		if isinstance(languages, str):
+			languages = [language.strip() for language in languages.split(',') if language.strip()]
+
+		for language in languages:
+			cls.checkLanguage(language)
+
+		if 'en' not in languages:
+			raise ValueError('Modules must at least support english (en).')
+
+		return {
+			'moduleName': className,
+			'githubUsername': githubUsername,
+			'moduleDescription': moduleDescription or '',
+			'languages': languages,
+			'languageList': ', '.join(languages)
+		}
+
+	def getTemplates(self):
+		if self.templates is None:
+			self.templates = []
+
+			for root, dirs, files in os.walk(self.templateDir):
+				for file in sorted(files):
+					if not file.endswith(self.SUFFIX):
+						continue
+
+					path = os.path.join(root, file)
+					relativePath = os.path.relpath(path, self.templateDir)[:-len(self.SUFFIX)].replace(os.sep, '/')
+					self.templates.append((Template(relativePath, relativePath), Template.fromFile(path)))
+
+		return self.templates
+
+	def plan(self, context, languages, cache = None):
+		# path -> [key, hash, render], templates whose key is in the cache are not rendered
+		files = {}
+
+		for pathTemplate, template in self.getTemplates():
+			if 'language' in pathTemplate.getPlaceholders():
+				contexts = [dict(context, language=language) for language in languages]
+			else:
+				contexts = [context]
+
+			for renderContext in contexts:
+				key = self.getRenderKey(pathTemplate, template, renderContext)
+				render = (lambda template=template, renderContext=renderContext: template.render(renderContext))
+				contentHash = cache.get(key) if cache is not None else None
+
+				if contentHash is None:
+					content = render()
+					contentHash = self.hash(content)
+					render = (lambda content=content: content)
+
+				files[pathTemplate.render(renderContext)] = [key, contentHash, render]
+
+		return files
+
+	@staticmethod
+	def getRenderKey(pathTemplate, template, context):
+		values = [[name, context[name]] for name in sorted(pathTemplate.getPlaceholders() | template.getPlaceholders()) if name in context]
+
+		return hashlib.sha256(json.dumps([pathTemplate.hash, template.hash, values], ensure_ascii=False).encode('utf-8')).hexdigest()
+
+	@staticmethod
+	def hash(content):
+		return hashlib.sha256(content.encode('utf-8') if isinstance(content, str) else content).hexdigest()
+
+	def render(self, context, languages):
+		return {path: render() for path, (key, contentHash, render) in self.plan(context, languages).items()}
+
+	def readManifest(self, destination):
+		try:
+			with open(os.path.join(destination, self.MANIFEST), 'r', encoding='utf-8') as handle:
+				manifest = json.load(handle)
+		except (OSError, ValueError):
+			return {}
+
+		if not isinstance(manifest, dict) or manifest.get('version') != self.MANIFEST_VERSION:
+			return {}
+
+		return manifest.get('files', {})
+
+	def dumpManifest(self, entries):
+		return json.dumps({'version': self.MANIFEST_VERSION, 'files': entries}, indent=4, sort_keys=True) + '\n'
+
+	@staticmethod
+	def getPaths(destination, paths):
+		# Paths come from templates and from the manifest stored in the module, neither may leave the module
+		root = os.path.realpath(destination)
+		targets = {}
+
+		for path in paths:
+			target = os.path.realpath(os.path.join(root, path))
+
+			if os.path.commonpath([root, target]) != root or target == root:
+				raise ValueError('The path {} is outside of the module directory {}.'.format(path, destination))
+
+			targets[path] = target
+
+		return targets
+
+	@staticmethod
+	def writeFile(target, content):
+		# Written next to the file and renamed over it, a file is never left half written
+		os.makedirs(os.path.dirname(target), exist_ok=True)
+		handle, tmpPath = tempfile.mkstemp(prefix='.{}.'.format(os.path.basename(target)), dir=os.path.dirname(target))
+
+		try:
+			with os.fdopen(handle, 'w', encoding='utf-8', newline='\n') as handle:
+				handle.write(content)
+
+			umask = os.umask(0)
+			os.umask(umask)
+			os.chmod(tmpPath, 0o666 & ~umask)
+			os.replace(tmpPath, target)
+		except BaseException:
+			os.unlink(tmpPath)
+			raise
+
+	@staticmethod
+	def getEntry(target, key, contentHash):
+		stat = os.stat(target)
+
+		return {'key': key, 'hash': contentHash, 'stamp': [stat.st_mtime_ns, stat.st_size]}
+
+	def getFileHash(self, target, entry):
+		try:
+			stat = os.stat(target)
+		except FileNotFoundError:
+			return None
+
+		# The file is only read when it was touched since it was generated
+		if entry is not None and entry.get('stamp') == [stat.st_mtime_ns, stat.st_size]:
+			return entry['hash']
+
+		with open(target, 'rb') as handle:
+			return self.hash(handle.read())
+
+	def write(self, files, destination):
+		destination = os.path.abspath(destination)
+
+		if os.path.exists(destination):
+			raise ValueError('The directory {} already exists.'.format(destination))
+
+		parent = os.path.dirname(destination)
+		os.makedirs(parent, exist_ok=True)
+		tmpDir = tempfile.mkdtemp(prefix='.{}.'.format(os.path.basename(destination)), dir=parent)
+
+		try:
+			targets = self.getPaths(tmpDir, files)
+
+			for directory in sorted(set(os.path.dirname(path) for path in files) - {''}):
+				os.makedirs(os.path.join(tmpDir, directory), exist_ok=True)
+
+			entries = {}
+
+			for path, (key, contentHash, render) in files.items():
+				with open(targets[path], 'w', encoding='utf-8', newline='\n') as handle:
+					handle.write(render())
+
+				entries[path] = self.getEntry(targets[path], key, contentHash)
+
+			with open(os.path.join(tmpDir, self.MANIFEST), 'w', encoding='utf-8', newline='\n') as handle:
+				handle.write(self.dumpManifest(entries))
+
+			# mkdtemp creates a private directory, the module gets the usual permissions
+			umask = os.umask(0)
+			os.umask(umask)
+			os.chmod(tmpDir, 0o777 & ~umask)
+			os.rename(tmpDir, destination)
+		except BaseException:
+			shutil.rmtree(tmpDir, ignore_errors=True)
+			raise
+
+		return destination
+
+	def update(self, context, languages, destination, dryRun = False):
+		previous = self.readManifest(destination)
+		files = self.plan(context, languages, {entry['key']: entry['hash'] for entry in previous.values()})
+		entries = {}
+		changes = []
+		# Checked before anything is touched, a tampered manifest fails the whole update
+		targets = self.getPaths(destination, set(files) | set(previous))
+
+		for path in sorted(targets):
+			entry = previous.get(path)
+			fileHash = self.getFileHash(targets[path], entry)
+
+			if path not in files:
+				if fileHash is None:
+					continue
+				elif entry is not None and fileHash != entry['hash']:
+					# Edited since it was generated, the file is left alone
+					changes.append((self.KEPT, path))
+					entries[path] = entry
+				else:
+					changes.append((self.REMOVED, path))
+
+					if not dryRun:
+						os.unlink(targets[path])
+
+				continue
+
+			key, contentHash, render = files[path]
+
+			if fileHash == contentHash:
+				status = self.UNCHANGED
+			elif fileHash is None:
+				status = self.CREATED
+			elif entry is None or fileHash != entry['hash']:
+				# Edited since it was generated, or not generated at all
+				status = self.KEPT
+			else:
+				status = self.UPDATED
+
+			changes.append((status, path))
+
+			if dryRun:
+				continue
+
+			if status == self.KEPT:
+				if entry is not None:
+					entries[path] = entry
+
+				continue
+
+			if status != self.UNCHANGED:
+				self.writeFile(targets[path], render())
+
+			entries[path] = self.getEntry(targets[path], key, contentHash)
+
+		if not dryRun and entries != previous:
+			self.writeFile(os.path.join(destination, self.MANIFEST), self.dumpManifest(entries))
+
+		return changes
+
+	def generate(self, context, languages, destination, dryRun = False):
+		destination = os.path.abspath(destination)
+
+		if os.path.isdir(destination):
+			return destination, self.update(context, languages, destination, dryRun)
+
+		files = self.plan(context, languages)
+
+		if not dryRun:
+			self.write(files, destination)
+
+		return destination, [(self.CREATED, path) for path in sorted(files)]
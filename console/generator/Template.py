@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import re
+import json
+import hashlib
+
+#
+# Template renders {{ name }} placeholders, {{ name|json }} renders the value as a JSON literal and
+# {{ name|docstring }} escapes it for a Python triple quoted string
+#
+# A template is compiled once into a list of literals and placeholders, rendering only joins them.
+# Templates read from files are cached by path and recompiled when the file changes, hash identifies the source.
+#
+class Template:
+
+	REGEX_PLACEHOLDER = re.compile(r'\{\{\s*([a-zA-Z0-9_]+)\s*(?:\|\s*([a-z]+)\s*)?\}\}')
+
+	FILTERS = {
+		'json': lambda value: json.dumps(value, ensure_ascii=False),
+		'docstring': lambda value: str(value).replace('\\', '\\\\').replace('"""', '\\"\\"\\"')
+	}
+
+	cache = {}
+
+	def __init__(self, source, name = None):
+		self.name = name
+		self.hash = hashlib.sha256(source.encode('utf-8')).hexdigest()
+		self.parts = []
+		self.placeholders = set()
+		position = 0
+
+		for match in self.REGEX_PLACEHOLDER.finditer(source):
+			if match.start() > position:
+				self.parts.append(source[position:match.start()])
+
+			filter = match.group(2)
+
+			if filter is not None and filter not in self.FILTERS:
+				raise ValueError('Unknown filter {} in template {}.'.format(filter, str(name)))
+
+			self.parts.append((match.group(1), self.FILTERS.get(filter)))
+			self.placeholders.add(match.group(1))
+			position = match.end()
+
+		if position < len(source):
+			self.parts.append(source[position:])
+
+	@classmethod
+	def fromFile(cls, path):
+		stat = os.stat(path)
+		stamp = (stat.st_mtime_ns, stat.st_size)
+		cached = cls.cache.get(path)
+
+		if cached is None or cached[0] != stamp:
+			with open(path, 'r', encoding='utf-8') as handle:
+				cached = (stamp, cls(handle.read(), path))
+
+			cls.cache[path] = cached
+
+		return cached[1]
+
+	def getPlaceholders(self):
+		return self.placeholders
+
+	def render(self, context):
+		chunks = []
+
+		for part in self.parts:
+			if type(part) is str:
+				chunks.append(part)
+				continue
+
+			name, filter = part
+
+			if name not in context:
+				raise ValueError('The template {} needs a value for {}.'.format(str(self.name), name))
+
+			chunks.append(filter(context[name]) if filter is not None else str(context[name]))
+
+		return ''.join(chunks)
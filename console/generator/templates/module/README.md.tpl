@@ -0,0 +1,21 @@
+# {{moduleName}}
+
+### Download
+
+> wget http://bit.ly/????????? -O ~/ProjectAlice/system/moduleInstallTickets/{{moduleName}}.install
+
+### Description
+
+{{moduleDescription}}
+
+- Version: 0.1
+- Author: {{githubUsername}}
+- Maintainers: N/A
+- Alice minimum Version: 0.1
+- Conditions:
+  - Languages: {{languageList}}
+- Requirements: N/A
+
+### Configuration
+
+This module has no configuration.
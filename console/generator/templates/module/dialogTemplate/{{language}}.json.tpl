@@ -0,0 +1,17 @@
+{
+	"module": {{moduleName|json}},
+	"icon": "",
+	"description": {{moduleDescription|json}},
+	"slotTypes": [],
+	"intents": [
+		{
+			"name": "{{moduleName}}Dummy",
+			"description": "Dummy intent, edit dialogTemplate/{{language}}.json and remove it",
+			"enabledByDefault": true,
+			"utterances": [
+				"dummy utterance"
+			],
+			"slots": []
+		}
+	]
+}
@@ -0,0 +1,8 @@
+{
+	"dummy": {
+		"default": [
+			"This is the dummy answer of {{moduleName}}"
+		],
+		"short": []
+	}
+}
@@ -0,0 +1,14 @@
+{
+	"name": {{moduleName|json}},
+	"version": 0.1,
+	"author": {{githubUsername|json}},
+	"maintainers": [],
+	"desc": {{moduleDescription|json}},
+	"aliceMinVersion": 0.1,
+	"commitsSha": "",
+	"pipRequirements": [],
+	"systemRequirements": [],
+	"conditions": {
+		"lang": {{languages|json}}
+	}
+}
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+from core.base.model.Intent import Intent
+from core.base.model.Module import Module
+from core.dialog.model.DialogSession import DialogSession
+
+
+class {{moduleName}}(Module):
+	"""
+	Author: {{githubUsername}}
+	Description: {{moduleDescription|docstring}}
+	"""
+
+	_INTENT_DUMMY = Intent('{{moduleName}}Dummy')
+
+	def __init__(self):
+		self._SUPPORTED_INTENTS = [
+			self._INTENT_DUMMY
+		]
+
+		super().__init__(self._SUPPORTED_INTENTS)
+
+
+	def onMessage(self, intent: str, session: DialogSession) -> bool:
+		if not self.filterIntent(intent, session):
+			return False
+
+		if intent == self._INTENT_DUMMY:
+			self.endDialog(session.sessionId, text=self.randomTalk('dummy'))
+
+		return True
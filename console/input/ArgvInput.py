@@ -13,6 +13,7 @@ import re
 import sys
 
 from console.input.Input import Input
+from console.input.StreamedValues import StreamedValues
 from console.Tools import indexOf
 
 #
@@ -23,7 +24,7 @@ class ArgvInput(Input):
 
 	def __init__(self, argv = None, definition = None, command = None, standalone = False):
 		self.tokens = None
-		self.parsed = None
+		self.cursor = 0
 		self.standalone = standalone
 
 		if not argv:
@@ -33,39 +34,51 @@ class ArgvInput(Input):
 		# if len(argv) != 0:
 		# 	argv.pop(0)
 
-		self.tokens = argv
+		self.setTokens(argv)
 
 		super(ArgvInput, self).__init__(definition=definition)
 
 	def setTokens(self, tokens):
 		self.tokens = tokens
+		self.scanTokens()
+
+	def scanTokens(self):
+		# A single pass indexes every option name present on the line (with and without its =value)
+		# and the first argument, so global flags are answered without rescanning the tokens
+		self.parameterOptions = set()
+		self.firstArgument = None
+
+		for token in self.tokens:
+			if token and '-' == token[0]:
+				self.parameterOptions.add(token)
+				pos = token.find('=')
+
+				if pos > 0:
+					self.parameterOptions.add(token[0:pos])
+			elif self.firstArgument is None:
+				self.firstArgument = token
 
 	def parse(self):
 		parseOptions = True
-		self.parsed = self.tokens.copy()
+		tokens = self.tokens
+		count = len(tokens)
+		self.cursor = 0
 
-		token = None
-
-		if len(self.parsed) != 0:
-			token = self.parsed.pop(0)
+		while self.cursor < count:
+			token = tokens[self.cursor]
+			self.cursor += 1
 
-		while token is not None:
 			if parseOptions and token == '':
 				self.parseArgument(token)
 			elif parseOptions and token == '--':
 				parseOptions = False
-			elif parseOptions and indexOf('--', token) == 0:
+			elif parseOptions and token.startswith('--'):
 				self.parseLongOption(token)
 			elif parseOptions and '-' == token[0] and '-' != token:
 				self.parseShortOption(token)
 			else:
 				self.parseArgument(token)
 
-			try:
-				token = self.parsed.pop(0)
-			except:
-				break
-
 	def parseShortOption(self, token):
 		name = token[1:]
 
@@ -104,26 +117,43 @@ class ArgvInput(Input):
 
 	def parseArgument(self, token):
 		c = len(self.arguments)
+		definition = self.definition
 
-		if self.definition.hasArgument(c):
-			arg = self.definition.getArgument(c)
+		if definition.hasArgument(c):
+			arg = definition.getArgument(c)
 
 			if arg.isArray():
-				self.arguments[arg.getName()] = [token]
+				self.arguments[arg.getName()] = self.addArrayValue(None, token)
 			else:
 				self.arguments[arg.getName()] = token
 
-		elif self.definition.hasArgument(c - 1) and self.definition.getArgument(c - 1).isArray():
-			arg = self.definition.getArgument(c - 1)
-
-			if arg.getName() not in self.arguments or self.arguments[arg.getName()] is None:
-				self.arguments[arg.getName()] = []
-
-			self.arguments[arg.getName()].append(token)
+		elif definition.hasArgument(c - 1) and definition.getArgument(c - 1).isArray():
+			name = definition.getArgument(c - 1).getName()
+			self.arguments[name] = self.addArrayValue(self.arguments.get(name), token)
 		else:
 			if not self.standalone:
 				raise ValueError('Too many arguments.')
 
+	def addArrayValue(self, values, value):
+		# '@file' and '@-' stream their values from a response file or stdin, '@@' escapes a literal '@'
+		if type(value) is str and value.startswith('@') and len(value) > 1:
+			if value[1] == '@':
+				value = value[1:]
+			else:
+				if type(values) is not StreamedValues:
+					values = StreamedValues(values)
+
+				values.addFile(value[1:])
+
+				return values
+
+		if values is None:
+			values = []
+
+		values.append(value)
+
+		return values
+
 	def addShortOption(self, shortcut, value):
 
 		if not self.definition.hasShortcut(shortcut):
@@ -142,18 +172,13 @@ class ArgvInput(Input):
 			raise ValueError('The --{} option does not accept a value : {}'.format(str(name),str(value)))
 
 
-		if value is None and option.acceptValue() and len(self.parsed):
-			next = None
+		if value is None and option.acceptValue() and self.cursor < len(self.tokens):
+			next = self.tokens[self.cursor]
 
-			if len(self.parsed) != 0:
-				next = self.parsed.pop(0)
-
-			if next[0] is not None and '-' != next[0]:
+			# The next token is the value unless it is another option
+			if next == '' or '-' != next[0]:
 				value = next
-			elif next == '':
-				value = ''
-			else:
-				self.parsed.insert(0, next)
+				self.cursor += 1
 
 		if value is None:
 			if option.isValueRequired():
@@ -166,26 +191,39 @@ class ArgvInput(Input):
 					value = True
 
 		if option.isArray():
-			if name not in self.options or self.options[name] is None:
-				self.options[name] = []
-
-			self.options[name].append(value)
+			self.options[name] = self.addArrayValue(self.options.get(name), value)
 		else:
 			self.options[name] = value
 
-	def getFirstArgument(self):
+	def getFirstArgument(self, definition = None):
+		if definition is None:
+			return self.firstArgument
+
+		# With the definition, the value of '--option value' is not taken for the first argument
+		skipValue = False
+
 		for token in self.tokens:
-			if '-' == token[0]:
-				continue
+			if skipValue:
+				skipValue = False
+			elif token and '-' == token[0]:
+				skipValue = '=' not in token and self.acceptValue(definition, token)
+			else:
+				return token
 
-			return token
+		return None
 
-	def hasParameterOption(self, values):
+	@staticmethod
+	def acceptValue(definition, token):
+		if token.startswith('--'):
+			return definition.hasOption(token[2:]) and definition.getOption(token[2:]).acceptValue()
 
-		for token in self.tokens:
-			for value in values:
-				if token == value or 0 == indexOf(value+'=', token):
-					return True
+		# A value stuck to its shortcut, as in -ofile, is part of the token
+		return len(token) == 2 and definition.hasShortcut(token[1]) and definition.getOptionForShortcut(token[1]).acceptValue()
+
+	def hasParameterOption(self, values):
+		for value in values:
+			if value in self.parameterOptions:
+				return True
 
 		return False
 
@@ -23,7 +23,7 @@ class ArrayInput(Input):
 
 		super(ArrayInput, self).__init__(definition)
 
-	def getFirstArgument(self):
+	def getFirstArgument(self, definition = None):
 		for key,value in self.parameters.items():
 			if key and '-' == key[0]:
 				continue
@@ -9,41 +9,59 @@
  # file that was distributed with this source code.
 ###
 
+import weakref
+
 #
 # InputArgument is a command line argument
 #
 class InputArgument:
 
+	__slots__ = ('name', 'mode', 'description', 'default', 'choices', 'frozen', 'required', 'array', '__weakref__')
+
 	REQUIRED = 1
 	OPTIONAL = 2
 	ARRAY = 4
 
-	def __init__(self, name, mode = None, description = '', default = None):
+	# Equal arguments are shared between definitions, see intern()
+	interned = weakref.WeakValueDictionary()
+
+	def __init__(self, name, mode = None, description = '', default = None, choices = None):
+		object.__setattr__(self, 'frozen', False)
 		self.mode = mode
 
 		if not mode:
 			self.mode = self.OPTIONAL
 
+		self.required = self.mode == self.REQUIRED & self.mode
+		self.array = self.mode == self.ARRAY & self.mode
 		self.setDefault(default)
 		self.name = name
 		self.description = description
+		self.choices = tuple(choices) if choices is not None else None
 
 	def getDescription(self):
 		return self.description
 
 	def getDefault(self):
-		return self.default
+		# A list default is copied, the argument may be shared with other definitions
+		return list(self.default) if type(self.default) is list else self.default
+
+	def getChoices(self):
+		return self.choices
 
 	def getName(self):
 		return self.name
 
 	def isRequired(self):
-		return self.mode == self.REQUIRED & self.mode
+		return self.required
 
 	def isArray(self):
-		return self.mode == self.ARRAY & self.mode
+		return self.array
 
 	def setDefault(self, definition):
+		if self.frozen:
+			raise ValueError('Cannot change the default value of the frozen argument {}.'.format(str(self.name)))
+
 		if self.mode == self.REQUIRED and definition is not None:
 			raise ValueError('Cannot set a default value except for OPTIONNAL mode')
 
@@ -56,5 +74,52 @@ class InputArgument:
 		self.default = definition
 
 
+	def freeze(self):
+		object.__setattr__(self, 'frozen', True)
+
+		return self
+
+	def isFrozen(self):
+		return self.frozen
+
+	def __setattr__(self, name, value):
+		# A frozen argument is shared between definitions by intern(), changing it would change them all
+		if self.frozen:
+			raise ValueError('Cannot change the frozen argument {}.'.format(str(self.name)))
+
+		object.__setattr__(self, name, value)
+
+	def getKey(self):
+		default = tuple(self.default) if type(self.default) is list else self.default
+
+		return (self.name, self.mode, self.description, default, self.choices)
+
+	@classmethod
+	def intern(cls, argument):
+		try:
+			canonical = cls.interned.get(argument.getKey())
+		except TypeError:
+			# Unhashable default, the argument cannot be shared
+			return argument.freeze()
+
+		if canonical is None:
+			canonical = argument.freeze()
+			cls.interned[argument.getKey()] = canonical
+
+		return canonical
+
+	def __eq__(self, other):
+		return isinstance(other, InputArgument) and self.getKey() == other.getKey()
+
+	def __hash__(self):
+		return hash(self.getKey())
+
+	def serialize(self):
+		return {'name': self.name, 'mode': self.mode, 'description': self.description, 'default': self.default, 'choices': self.choices}
+
+	@staticmethod
+	def unserialize(data):
+		return InputArgument(data['name'], data['mode'], data['description'], data['default'], data.get('choices'))
+
 	def __str__(self):
-		return '([{}] name={}, description={})'.format(self.__class__.__name__, self.name, self.description)
\ No newline at end of file
+		return '([{}] name={}, description={})'.format(self.__class__.__name__, self.name, self.description)
\ No newline at end of file
@@ -9,22 +9,31 @@
  # file that was distributed with this source code.
 ###
 
+from console.input.InputArgument import InputArgument
 from console.input.InputOption import InputOption
-from console.Tools import toArray, isInt
 
 #
 # InputDefinition is a collection of InputArgument and InputOption
 #
 class InputDefinition:
 
+	__slots__ = ('arguments', 'argumentList', 'requiredCount', 'hasAnArrayArgument', 'hasOptional',
+		'options', 'shortcuts', 'shortcutOptions', 'frozen', 'key')
+
+	# Merged definitions, shared by every command with the same native and application definitions
+	mergedDefinitions = {}
 
 	def __init__(self, definition = []):
 		self.arguments = {}
+		self.argumentList = []
 		self.requiredCount = 0
 		self.hasAnArrayArgument = False
 		self.hasOptional = False
 		self.options = {}
 		self.shortcuts = {}
+		self.shortcutOptions = {}
+		self.frozen = False
+		self.key = None
 		self.setDefinition(definition)
 
 	def setDefinition(self, definition):
@@ -45,7 +54,10 @@ class InputDefinition:
 		self.setOptions(options)
 
 	def setArguments(self, _arguments):
+		self.assertNotFrozen()
+		self.key                = None
 		self.arguments          = {}
+		self.argumentList       = []
 		self.requiredCount      = 0
 		self.hasOptional        = False
 		self.hasAnArrayArgument = False
@@ -57,6 +69,8 @@ class InputDefinition:
 				self.addArgument(argument)
 
 	def addArgument(self, argument):
+		self.assertNotFrozen()
+
 		if argument.getName() in self.arguments and self.arguments[argument.getName()]:
 			raise ValueError('An argument with name {} already exists.'.format(str(argument.getName())))
 
@@ -74,29 +88,26 @@ class InputDefinition:
 		else:
 			self.hasOptional = True
 
+		argument = InputArgument.intern(argument)
+		self.key = None
 		self.arguments[argument.getName()] = argument
+		self.argumentList.append(argument)
 
 	def getArgument(self, name):
 		if not self.hasArgument(name):
 			raise ValueError('The {} argument does not exist.'.format(str(name)))
 
-		_arguments = None
-
-		if isInt(name):
-			_arguments = toArray(self.arguments)
-		else:
-			_arguments = self.arguments
+		# Positions are resolved through the ordered index, names through the dict
+		if type(name) is int:
+			return self.argumentList[name]
 
-		return _arguments[name]
+		return self.arguments[name]
 
 	def hasArgument(self, name):
-		_arguments = self.arguments
-
-		if isInt(name):
-			_arguments = toArray(self.arguments)
-			return name < len(_arguments)
+		if type(name) is int:
+			return name < len(self.argumentList)
 
-		return name in _arguments
+		return name in self.arguments
 
 	def getArguments(self):
 		return self.arguments
@@ -111,7 +122,7 @@ class InputDefinition:
 		return self.requiredCount
 
 	def getArgumentDefaults(self):
-		values = []
+		values = {}
 
 		for index,argument in self.arguments.items():
 			values[argument.getName()] = argument.getDefault()
@@ -119,8 +130,11 @@ class InputDefinition:
 		return values
 
 	def setOptions(self, options):
+		self.assertNotFrozen()
+		self.key = None
 		self.options = {}
 		self.shortcuts = {}
+		self.shortcutOptions = {}
 		self.addOptions(options)
 
 	def addOptions(self, options):
@@ -128,6 +142,8 @@ class InputDefinition:
 			self.addOption(option)
 
 	def addOption(self, option):
+		self.assertNotFrozen()
+
 		if option.getName() in self.options and self.options[option.getName()]:
 			raise ValueError('An option named {} already exists.'.format(str(option.getName())))
 
@@ -136,11 +152,14 @@ class InputDefinition:
 				if shortcut in self.shortcuts:
 					raise ValueError('An option with shortcut -{} already exists.'.format(str(shortcut)))
 
+		option = InputOption.intern(option)
+		self.key = None
 		self.options[option.getName()] = option
 
 		if option.getShortcut():
 			for shortcut in option.getShortcut().split('|'):
 				self.shortcuts[shortcut] = option.getName()
+				self.shortcutOptions[shortcut] = option
 
 	def getOption(self, name):
 		if not self.hasOption(name):
@@ -158,10 +177,13 @@ class InputDefinition:
 		return name in self.shortcuts
 
 	def getOptionForShortcut(self, shortcut):
-		return self.getOption(self.shortcutToName(shortcut))
+		if shortcut not in self.shortcutOptions:
+			raise ValueError('The -{} option does not exist.'.format(str(shortcut)))
+
+		return self.shortcutOptions[shortcut]
 
 	def getOptionDefaults(self):
-		values = []
+		values = {}
 
 		for index,option in self.options.items():
 			values[option.getName()] = option.getDefault()
@@ -216,7 +238,66 @@ class InputDefinition:
 		return ' '.join(elements)
 
 
+	def freeze(self):
+		self.frozen = True
+
+		return self
+
+	def isFrozen(self):
+		return self.frozen
+
+	def assertNotFrozen(self):
+		if self.frozen:
+			raise ValueError('A frozen InputDefinition cannot be modified.')
+
+	def getKey(self):
+		if self.key is None:
+			self.key = (
+				tuple(argument.getKey() for argument in self.argumentList),
+				tuple(option.getKey() for option in self.options.values())
+			)
+
+		return self.key
+
+	@staticmethod
+	def merge(applicationDefinition, definition, mergeArgs = True):
+		try:
+			key = (applicationDefinition.getKey(), definition.getKey(), mergeArgs)
+			merged = InputDefinition.mergedDefinitions.get(key)
+		except TypeError:
+			key = None
+			merged = None
+
+		if merged is None:
+			merged = InputDefinition()
+
+			if mergeArgs:
+				merged.addArguments(applicationDefinition.getArguments())
+
+			merged.addArguments(definition.getArguments())
+			merged.addOptions(definition.getOptions())
+			merged.addOptions(applicationDefinition.getOptions())
+			merged.freeze()
+
+			if key is not None:
+				InputDefinition.mergedDefinitions[key] = merged
+
+		return merged
+
+	def serialize(self):
+		return {
+			'arguments': [argument.serialize() for argument in self.arguments.values()],
+			'options': [option.serialize() for option in self.options.values()]
+		}
+
+	@staticmethod
+	def unserialize(data):
+		definition = [InputArgument.unserialize(argument) for argument in data['arguments']]
+		definition += [InputOption.unserialize(option) for option in data['options']]
+
+		return InputDefinition(definition)
+
 	def __str__(self):
 		return '([{}] arguments={}, options={}, shortcuts={})'.format(
 			self.__class__.__name__, self.arguments, self.options, self.shortcuts
-		)
\ No newline at end of file
+		)
\ No newline at end of file
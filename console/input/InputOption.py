@@ -10,6 +10,7 @@
 ###
 
 import re
+import weakref
 
 from console.Tools import indexOf
 
@@ -18,12 +19,20 @@ from console.Tools import indexOf
 #
 class InputOption:
 
+	__slots__ = ('name', 'shortcut', 'mode', 'description', 'default', 'choices', 'frozen',
+		'valueRequired', 'valueOptional', 'valueIsArray', 'valueAccepted', '__weakref__')
+
 	VALUE_NONE = 1
 	VALUE_REQUIRED = 2
 	VALUE_OPTIONAL = 4
 	VALUE_IS_ARRAY = 8
 
-	def __init__(self, name, shortcut, mode, description, default = None):
+	# Equal options are shared between definitions, see intern()
+	interned = weakref.WeakValueDictionary()
+
+	def __init__(self, name, shortcut, mode, description, default = None, choices = None):
+		object.__setattr__(self, 'frozen', False)
+
 		if indexOf('--', name) == 0:
 			name = name[2:]
 		
@@ -51,6 +60,13 @@ class InputOption:
 		self.mode        = mode
 		self.description = description
 		self.default = []
+		self.choices = tuple(choices) if choices is not None else None
+
+		# The mode never changes once built, its flags are computed once for the parsers
+		self.valueRequired = self.VALUE_REQUIRED == (self.VALUE_REQUIRED & mode)
+		self.valueOptional = self.VALUE_OPTIONAL == (self.VALUE_OPTIONAL & mode)
+		self.valueIsArray  = self.VALUE_IS_ARRAY == (self.VALUE_IS_ARRAY & mode)
+		self.valueAccepted = self.valueRequired or self.valueOptional
 
 		if self.isArray() and not self.acceptValue():
 			raise ValueError('Impossible to have an option mode VALUE_IS_ARRAY if the option does not accept a value.')
@@ -64,18 +80,20 @@ class InputOption:
 		return self.name
 
 	def acceptValue(self):
-		return self.isValueRequired() or self.isValueOptional()
+		return self.valueAccepted
 
 	def isValueRequired(self):
-		return self.VALUE_REQUIRED == (self.VALUE_REQUIRED & self.mode)
+		return self.valueRequired
 
 	def isValueOptional(self):
-		return self.VALUE_OPTIONAL == (self.VALUE_OPTIONAL & self.mode)
+		return self.valueOptional
 
 	def isArray(self):
-		return self.VALUE_IS_ARRAY == (self.VALUE_IS_ARRAY & self.mode)
+		return self.valueIsArray
 
 	def setDefault(self, default):
+		if self.frozen:
+			raise ValueError('Cannot change the default value of the frozen option {}.'.format(str(self.name)))
 
 		if self.VALUE_NONE == (self.VALUE_NONE & self.mode) and default is not None:
 			raise ValueError('Cannot set a default value when using InputOption.VALUE_NONE mode.')
@@ -92,11 +110,55 @@ class InputOption:
 			self.default = False
 
 	def getDefault(self):
-		return self.default
+		# A list default is copied, the option may be shared with other definitions
+		return list(self.default) if type(self.default) is list else self.default
 
 	def getDescription(self):
 		return self.description
 
+	def getChoices(self):
+		return self.choices
+
+	def freeze(self):
+		object.__setattr__(self, 'frozen', True)
+
+		return self
+
+	def isFrozen(self):
+		return self.frozen
+
+	def __setattr__(self, name, value):
+		# A frozen option is shared between definitions by intern(), changing it would change them all
+		if self.frozen:
+			raise ValueError('Cannot change the frozen option {}.'.format(str(self.name)))
+
+		object.__setattr__(self, name, value)
+
+	def getKey(self):
+		default = tuple(self.default) if type(self.default) is list else self.default
+
+		return (self.name, self.shortcut, self.mode, self.description, default, self.choices)
+
+	@classmethod
+	def intern(cls, option):
+		try:
+			canonical = cls.interned.get(option.getKey())
+		except TypeError:
+			# Unhashable default, the option cannot be shared
+			return option.freeze()
+
+		if canonical is None:
+			canonical = option.freeze()
+			cls.interned[option.getKey()] = canonical
+
+		return canonical
+
+	def __eq__(self, other):
+		return isinstance(other, InputOption) and self.getKey() == other.getKey()
+
+	def __hash__(self):
+		return hash(self.getKey())
+
 	def equals(self, option):
 		return option.getName() == self.getName() and \
 			option.getShortcut() == self.getShortcut() and \
@@ -105,5 +167,9 @@ class InputOption:
 			option.isValueRequired() == self.isValueRequired() and \
 			option.isValueOptional() == self.isValueOptional()
 
+	def serialize(self):
+		return {'name': self.name, 'shortcut': self.shortcut, 'mode': self.mode, 'description': self.description, 'default': self.default if self.acceptValue() else None, 'choices': self.choices}
 
-
+	@staticmethod
+	def unserialize(data):
+		return InputOption(data['name'], data['shortcut'], data['mode'], data['description'], data['default'], data.get('choices'))
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import sys
+import mmap
+import tempfile
+
+#
+# StreamedValues is a re-iterable view over the values of an array argument or option
+#
+# Values given on the command line are kept as is, '@path' values are read lazily, one per line,
+# from a memory-mapped file and '@-' from stdin. What has been read from stdin is spooled to a
+# temporary file shared by every view, so stdin can be iterated again. Empty lines are skipped.
+#
+class StreamedValues:
+
+	STDIN = '-'
+
+	stdinSpool = None
+	stdinSpoolSize = 0
+	stdinConsumed = False
+
+	def __init__(self, values = None):
+		self.sources = []
+
+		if values:
+			self.sources.append(list(values))
+
+	def append(self, value):
+		if len(self.sources) == 0 or type(self.sources[-1]) is not list:
+			self.sources.append([])
+
+		self.sources[-1].append(value)
+
+	def addFile(self, path):
+		if path != self.STDIN and not os.path.isfile(path):
+			raise ValueError('The response file {} does not exist.'.format(str(path)))
+
+		self.sources.append(path)
+
+	def __iter__(self):
+		for source in self.sources:
+			if type(source) is list:
+				yield from source
+			elif source == self.STDIN:
+				yield from self.iterateStdin()
+			else:
+				yield from self.iterateFile(source)
+
+	def iterateFile(self, path):
+		with open(path, 'rb') as handle:
+			if os.fstat(handle.fileno()).st_size == 0:
+				return
+
+			with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+				start = 0
+				size = len(mapped)
+
+				while start < size:
+					end = mapped.find(b'\n', start)
+
+					if end < 0:
+						end = size
+
+					line = mapped[start:end].rstrip(b'\r')
+					start = end + 1
+
+					if line:
+						yield line.decode('utf-8')
+
+	def iterateStdin(self):
+		cls = StreamedValues
+
+		if cls.stdinSpool is None:
+			cls.stdinSpool = tempfile.TemporaryFile()
+
+		position = 0
+
+		while True:
+			if position < cls.stdinSpoolSize:
+				cls.stdinSpool.seek(position)
+				line = cls.stdinSpool.readline()
+			elif cls.stdinConsumed:
+				break
+			else:
+				line = sys.stdin.buffer.readline()
+
+				if not line:
+					cls.stdinConsumed = True
+					break
+
+				cls.stdinSpool.seek(0, os.SEEK_END)
+				cls.stdinSpool.write(line)
+				cls.stdinSpoolSize += len(line)
+
+			position += len(line)
+			line = line.rstrip(b'\r\n')
+
+			if line:
+				yield line.decode('utf-8')
+
+	def __str__(self):
+		return '([{}] sources={})'.format(self.__class__.__name__, ', '.join('@' + source if type(source) is str else str(source) for source in self.sources))
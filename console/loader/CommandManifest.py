@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import sys
+import marshal
+
+#
+# CommandManifest is an on-disk cache describing every registered command
+#
+# Each entry holds the name, aliases, description, help, synopsis and the serialized InputDefinition
+# of a command, along with the source file it was built from. An entry stays valid as long as the
+# mtime and size of its source file do not change, so list/help can be served without importing commands.
+# The application definition and version, and the source files of the application classes and of the
+# base classes every entry is built with are kept alongside: when they change every entry is dropped,
+# and shell completion can trust the manifest without building the application. It is stored with marshal,
+# which unlike json needs no import: loading the manifest is on the completion latency budget.
+# The CommandMatcher index is kept marshalled on its own, it is only decoded when a lookup failed.
+#
+class CommandManifest:
+
+	VERSION = 3
+
+	# Relative to the console package, synopses and definitions of every command depend on them
+	BASE_SOURCES = ['Command.py', 'input/InputDefinition.py', 'input/InputArgument.py', 'input/InputOption.py', 'loader/CommandManifest.py']
+
+	def __init__(self, path = None):
+		self.path = path
+		self.entries = {}
+		self.application = None
+		self.matcherIndex = None
+		self.dirty = False
+		self.load()
+
+	@staticmethod
+	def getDefaultPath(applicationName):
+		cacheDir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+
+		return os.path.join(cacheDir, applicationName, 'commands.cache')
+
+	@staticmethod
+	def getSourceStamp(source):
+		if source is None:
+			return None
+
+		try:
+			stat = os.stat(source)
+		except OSError:
+			return None
+
+		return [source, stat.st_mtime_ns, stat.st_size]
+
+	@staticmethod
+	def describe(command, stamp = None):
+		return {
+			'name': command.getName(),
+			'aliases': list(command.getAliases()),
+			'description': command.getDescription(),
+			'help': command.getHelp(),
+			'synopsis': command.getSynopsis(),
+			'definition': command.getDefinition().serialize(),
+			'source': stamp
+		}
+
+	@staticmethod
+	def describeApplication(application):
+		sources = []
+
+		for cls in type(application).__mro__[:-1]:
+			stamp = CommandManifest.getSourceStamp(getattr(sys.modules.get(cls.__module__), '__file__', None))
+
+			if stamp is not None:
+				sources.append(stamp)
+
+		package = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+		for source in CommandManifest.BASE_SOURCES:
+			stamp = CommandManifest.getSourceStamp(os.path.join(package, source))
+
+			if stamp is not None:
+				sources.append(stamp)
+
+		return {
+			'definition': application.getDefinition().serialize(),
+			'version': application.getVersion(),
+			'sources': sources
+		}
+
+	def getPath(self):
+		return self.path
+
+	def load(self):
+		self.entries = {}
+		self.application = None
+		self.matcherIndex = None
+
+		if self.path is None:
+			return
+
+		try:
+			with open(self.path, 'rb') as handle:
+				data = marshal.load(handle)
+		except (OSError, EOFError, ValueError, TypeError):
+			return
+
+		if type(data) is not dict or data.get('version') != self.VERSION:
+			return
+
+		for name, entry in data.get('commands', {}).items():
+			self.set(name, entry)
+
+		self.application = data.get('application')
+		self.matcherIndex = data.get('matcher')
+
+		self.dirty = False
+
+	def save(self):
+		if self.path is None or not self.dirty:
+			return
+
+		tmpPath = '{}.{}.tmp'.format(self.path, os.getpid())
+
+		try:
+			os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+			with open(tmpPath, 'wb') as handle:
+				marshal.dump({'version': self.VERSION, 'application': self.application, 'commands': self.entries, 'matcher': self.matcherIndex}, handle)
+
+			os.replace(tmpPath, self.path)
+			self.dirty = False
+		except OSError:
+			# The manifest is only a cache, a read-only home must not break the console
+			if os.path.exists(tmpPath):
+				os.remove(tmpPath)
+
+	def isUpToDate(self):
+		if self.application is None:
+			return False
+
+		stamps = list(self.application['sources'])
+		stamps += [entry['source'] for entry in self.entries.values() if entry.get('source') is not None]
+		checked = set()
+
+		for stamp in stamps:
+			if stamp[0] in checked:
+				continue
+
+			if self.getSourceStamp(stamp[0]) != stamp:
+				return False
+
+			checked.add(stamp[0])
+
+		return True
+
+	def isFresh(self, name, stamp):
+		return stamp is not None and name in self.entries and self.entries[name].get('source') == stamp
+
+	def has(self, name):
+		return name in self.entries
+
+	def getApplication(self):
+		return self.application
+
+	def setApplication(self, application):
+		if application != self.application:
+			self.application = application
+			self.entries = {}
+			self.matcherIndex = None
+			self.dirty = True
+
+	def hasMatcherIndex(self):
+		return self.matcherIndex is not None
+
+	def getMatcherIndex(self):
+		if self.matcherIndex is None:
+			return None
+
+		return marshal.loads(self.matcherIndex)
+
+	def setMatcherIndex(self, index):
+		self.matcherIndex = marshal.dumps(index)
+		self.dirty = True
+
+	def get(self, name):
+		if name not in self.entries:
+			raise ValueError('The command \'{}\' does not exist.'.format(str(name)))
+
+		return self.entries[name]
+
+	def set(self, name, entry):
+		self.entries[name] = entry
+		self.matcherIndex = None
+		self.dirty = True
+
+	def remove(self, name):
+		if name not in self.entries:
+			return
+
+		del self.entries[name]
+		self.matcherIndex = None
+		self.dirty = True
+
+	def getNames(self):
+		return list(self.entries)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import sys
+import importlib
+import importlib.util
+
+#
+# FactoryCommandLoader maps command names to a factory and builds a command only when it is requested
+#
+# A factory is either a callable returning a Command or an import path 'package.module.ClassName',
+# the module is then imported the first time the command is loaded.
+#
+class FactoryCommandLoader:
+
+
+	def __init__(self, factories = None):
+		self.factories = {}
+
+		if factories:
+			for name, factory in factories.items():
+				self.add(name, factory)
+
+	def add(self, name, factory):
+		if not callable(factory) and not isinstance(factory, str):
+			raise ValueError('The factory of command \'{}\' must be a callable or an import path.'.format(str(name)))
+
+		self.factories[name] = factory
+
+		return self
+
+	def has(self, name):
+		return name in self.factories
+
+	def get(self, name):
+		if not self.has(name):
+			raise ValueError('The command \'{}\' does not exist.'.format(str(name)))
+
+		factory = self.factories[name]
+
+		if isinstance(factory, str):
+			factory = self.importFactory(factory)
+			self.factories[name] = factory
+
+		return factory()
+
+	def getNames(self):
+		return list(self.factories)
+
+	def getFactory(self, name):
+		return self.factories[name]
+
+	def getSource(self, name):
+		factory = self.factories[name]
+
+		if isinstance(factory, str):
+			# Locating the module file does not execute it
+			try:
+				spec = importlib.util.find_spec(factory.rpartition('.')[0])
+			except (ImportError, ValueError):
+				return None
+
+			return spec.origin if spec is not None else None
+
+		module = sys.modules.get(getattr(factory, '__module__', None))
+
+		return getattr(module, '__file__', None)
+
+	def importFactory(self, path):
+		modulePath, _, className = path.rpartition('.')
+
+		if not modulePath:
+			raise ValueError('Import path \'{}\' must be formed as \'package.module.ClassName\'.'.format(str(path)))
+
+		return getattr(importlib.import_module(modulePath), className)
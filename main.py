@@ -1,6 +1,17 @@
 # -*- coding: utf-8 -*-
 
+import sys
+
+# Shell completion must answer fast, it is served from the command manifest before anything heavy is imported
+if sys.argv[1:2] == ['_complete']:
+	from console.Completion import Completion
+	sys.exit(Completion('AliceConsole', 'console.Application.Application').run(sys.argv[2:]))
+
 from console.Application import Application
 from console.input.ArgvInput import ArgvInput
 
-Application().run(ArgvInput())
\ No newline at end of file
+if sys.argv[1:2] == ['--daemon']:
+	from console.daemon.DaemonServer import DaemonServer
+	DaemonServer(Application(), sys.argv[2] if len(sys.argv) > 2 else None).serve()
+else:
+	sys.exit(Application().run(ArgvInput()))
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import unittest
+
+from console.CommandTrie import CommandTrie
+
+#
+# CommandTrie tests: names, aliases and abbreviations resolve per namespace level, ambiguity is reported
+#
+# Usage: python -m unittest discover -s tests -t .
+#
+class CommandTrieTest(unittest.TestCase):
+
+	def setUp(self):
+		self.trie = CommandTrie()
+
+		for name in ['list', 'help', 'batch', 'module:generate', 'module:generate-batch', 'cache:clear', 'cache:warmup']:
+			self.trie.add(name)
+
+		self.trie.add('ls', 'list')
+
+	def testExactName(self):
+		self.assertEqual(self.trie.resolve('module:generate'), ['module:generate'])
+
+	def testAbbreviation(self):
+		self.assertEqual(self.trie.resolve('mod:generate-b'), ['module:generate-batch'])
+		self.assertEqual(self.trie.resolve('ca:cl'), ['cache:clear'])
+		self.assertEqual(self.trie.resolve('he'), ['help'])
+
+	def testAmbiguity(self):
+		self.assertEqual(self.trie.resolve('mod:gen'), ['module:generate', 'module:generate-batch'])
+		self.assertEqual(self.trie.resolve('ca:'), ['cache:clear', 'cache:warmup'])
+
+	def testAlias(self):
+		self.assertEqual(self.trie.resolve('ls'), ['list'])
+
+	def testNamespaceOnly(self):
+		self.assertEqual(self.trie.resolve('module'), [])
+		self.assertEqual(self.trie.resolve('unknown:clear'), [])
+
+	def testAddedAfterAbbreviation(self):
+		self.assertEqual(self.trie.resolve('ca:w'), ['cache:warmup'])
+		self.trie.add('cache:wipe')
+
+		self.assertEqual(self.trie.resolve('ca:w'), ['cache:warmup', 'cache:wipe'])
+
+
+if __name__ == '__main__':
+	unittest.main()
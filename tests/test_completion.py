@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+from benchmark.complete import BUDGET, FORBIDDEN, complete, getImportedModules, measure
+
+#
+# Completion tests: `main.py _complete` answers from the command manifest, within its latency budget
+#
+# Usage: python -m unittest discover -s tests -t .
+#
+class CompletionTest(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		# A manifest of our own, the first call builds it
+		cls.cacheDir = tempfile.mkdtemp(prefix='aliceconsole-test-')
+		cls.environ = os.environ.get('XDG_CACHE_HOME')
+		os.environ['XDG_CACHE_HOME'] = cls.cacheDir
+		complete('main.py ')
+
+	@classmethod
+	def tearDownClass(cls):
+		if cls.environ is None:
+			del os.environ['XDG_CACHE_HOME']
+		else:
+			os.environ['XDG_CACHE_HOME'] = cls.environ
+
+		shutil.rmtree(cls.cacheDir, ignore_errors=True)
+
+	def testCommandNames(self):
+		self.assertEqual(complete('main.py module:gen').split('\n')[:-1], ['generate', 'generate-batch'])
+
+	def testOptions(self):
+		candidates = complete('main.py module:generate --out').split('\n')[:-1]
+
+		self.assertEqual(candidates, ['--output'])
+
+	def testImports(self):
+		for line in ['main.py ', 'main.py module:generate --']:
+			modules = getImportedModules(line)
+			forbidden = [module for module in modules if module.split('.')[0] in FORBIDDEN or module in FORBIDDEN]
+
+			self.assertEqual(forbidden, [], 'completing {!r} imports {}'.format(line, ', '.join(forbidden)))
+
+	def testLatency(self):
+		baseline = measure(subprocess.run, [sys.executable, '-c', 'pass'])
+		elapsed = measure(complete, 'main.py module:generate --')
+
+		self.assertLess(elapsed - baseline, BUDGET, 'completion takes {:.3f} ms over the interpreter startup'.format((elapsed - baseline) * 1000))
+
+
+if __name__ == '__main__':
+	unittest.main()
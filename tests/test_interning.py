@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import unittest
+
+from console.input.InputArgument import InputArgument
+from console.input.InputDefinition import InputDefinition
+from console.input.InputOption import InputOption
+
+#
+# Interning tests: equal arguments and options are shared between definitions, so they cannot be changed
+#
+# Usage: python -m unittest discover -s tests -t .
+#
+class InterningTest(unittest.TestCase):
+
+	def buildDefinition(self):
+		return InputDefinition([
+			InputArgument('files', InputArgument.ARRAY, 'Files', ['a.txt']),
+			InputOption('--tag', 't', InputOption.VALUE_REQUIRED | InputOption.VALUE_IS_ARRAY, 'Tags', ['x'])
+		])
+
+	def testShared(self):
+		self.assertIs(self.buildDefinition().getArgument('files'), self.buildDefinition().getArgument('files'))
+
+	def testArrayDefaults(self):
+		first, second = self.buildDefinition(), self.buildDefinition()
+		first.getArgument('files').getDefault().append('b.txt')
+		first.getOption('tag').getDefault().append('y')
+
+		self.assertEqual(second.getArgument('files').getDefault(), ['a.txt'])
+		self.assertEqual(second.getOption('tag').getDefault(), ['x'])
+
+	def testFrozen(self):
+		definition = self.buildDefinition()
+
+		with self.assertRaises(ValueError):
+			definition.getArgument('files').name = 'other'
+
+		with self.assertRaises(ValueError):
+			definition.getOption('tag').setDefault(['y'])
+
+		self.assertEqual(self.buildDefinition().getArgument('files').getName(), 'files')
+
+	def testNotInterned(self):
+		argument = InputArgument('files', InputArgument.ARRAY, 'Files')
+		argument.setDefault(['c.txt'])
+		argument.description = 'Other files'
+
+		self.assertFalse(argument.isFrozen())
+		self.assertEqual(argument.getDefault(), ['c.txt'])
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+###
+ # This file is part of the AliceConsole package.
+ #
+ # (c) Jierka <https://github.com/jr-k>
+ #
+ # For the full copyright and license information, please view the LICENSE
+ # file that was distributed with this source code.
+###
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from console.generator.ModuleGenerator import ModuleGenerator
+
+#
+# ModuleGenerator tests: generating into an existing module only touches the files it generated itself
+#
+# Usage: python -m unittest discover -s tests -t .
+#
+class ModuleGeneratorTest(unittest.TestCase):
+
+	def setUp(self):
+		self.generator = ModuleGenerator()
+		self.tmpDir = tempfile.mkdtemp(prefix='aliceconsole-test-')
+		self.destination = os.path.join(self.tmpDir, 'modules', 'Foo')
+
+	def tearDown(self):
+		shutil.rmtree(self.tmpDir, ignore_errors=True)
+
+	def generate(self, description = 'A foo', languages = 'en,fr', dryRun = False):
+		context = ModuleGenerator.buildContext('foo', 'jr-k', description, languages)
+
+		return dict((path, status) for status, path in self.generator.generate(context, context['languages'], self.destination, dryRun)[1])
+
+	def read(self, path):
+		with open(os.path.join(self.destination, path), 'r', encoding='utf-8') as handle:
+			return handle.read()
+
+	def edit(self, path, content):
+		with open(os.path.join(self.destination, path), 'w', encoding='utf-8') as handle:
+			handle.write(content)
+
+	def getTree(self):
+		tree = {}
+
+		for root, directories, files in os.walk(self.tmpDir):
+			for name in files:
+				with open(os.path.join(root, name), 'rb') as handle:
+					tree[os.path.relpath(os.path.join(root, name), self.tmpDir)] = handle.read()
+
+		return tree
+
+	def testCreated(self):
+		changes = self.generate()
+
+		self.assertEqual(set(changes.values()), {ModuleGenerator.CREATED})
+		self.assertIn('dialogTemplate/fr.json', changes)
+		self.assertTrue(os.path.isfile(os.path.join(self.destination, ModuleGenerator.MANIFEST)))
+
+		for path in changes:
+			self.assertTrue(os.path.isfile(os.path.join(self.destination, path)), path)
+
+	def testUnchanged(self):
+		self.generate()
+		tree = self.getTree()
+		changes = self.generate()
+
+		self.assertEqual(set(changes.values()), {ModuleGenerator.UNCHANGED})
+		self.assertEqual(self.getTree(), tree)
+
+	def testUpdated(self):
+		self.generate()
+		changes = self.generate(description='Another foo')
+
+		self.assertEqual(changes['README.md'], ModuleGenerator.UPDATED)
+		self.assertEqual(changes['talks/en.json'], ModuleGenerator.UNCHANGED)
+		self.assertIn('Another foo', self.read('README.md'))
+
+	def testKept(self):
+		self.generate()
+		self.edit('README.md', 'Edited by hand\n')
+		changes = self.generate(description='Another foo')
+
+		self.assertEqual(changes['README.md'], ModuleGenerator.KEPT)
+		self.assertEqual(self.read('README.md'), 'Edited by hand\n')
+
+		# Still kept on the next run, the manifest remembers the generated content
+		self.assertEqual(self.generate(description='Another foo')['README.md'], ModuleGenerator.KEPT)
+
+	def testRemoved(self):
+		self.generate()
+		self.edit('talks/fr.json', '{}\n')
+		changes = self.generate(languages='en')
+
+		self.assertEqual(changes['dialogTemplate/fr.json'], ModuleGenerator.REMOVED)
+		self.assertFalse(os.path.exists(os.path.join(self.destination, 'dialogTemplate', 'fr.json')))
+
+		# Edited by hand, the file is kept even though no template renders it anymore
+		self.assertEqual(changes['talks/fr.json'], ModuleGenerator.KEPT)
+		self.assertEqual(self.read('talks/fr.json'), '{}\n')
+
+	def testDryRunCreate(self):
+		changes = self.generate(dryRun=True)
+
+		self.assertEqual(set(changes.values()), {ModuleGenerator.CREATED})
+		self.assertEqual(self.getTree(), {})
+		self.assertFalse(os.path.exists(os.path.dirname(self.destination)))
+
+	def testDryRunUpdate(self):
+		self.generate()
+		self.edit('talks/en.json', '{}\n')
+		tree = self.getTree()
+		changes = self.generate(description='Another foo', languages='en', dryRun=True)
+
+		self.assertEqual(changes['README.md'], ModuleGenerator.UPDATED)
+		self.assertEqual(changes['talks/en.json'], ModuleGenerator.KEPT)
+		self.assertEqual(changes['dialogTemplate/fr.json'], ModuleGenerator.REMOVED)
+		self.assertEqual(self.getTree(), tree)
+
+	def testTamperedManifest(self):
+		self.generate()
+		outside = os.path.join(self.tmpDir, 'outside.txt')
+
+		with open(outside, 'w', encoding='utf-8') as handle:
+			handle.write('Not part of the module\n')
+
+		with open(os.path.join(self.destination, ModuleGenerator.MANIFEST), 'r', encoding='utf-8') as handle:
+			manifest = json.load(handle)
+
+		manifest['files']['../../outside.txt'] = dict(manifest['files']['README.md'])
+
+		with open(os.path.join(self.destination, ModuleGenerator.MANIFEST), 'w', encoding='utf-8') as handle:
+			json.dump(manifest, handle)
+
+		tree = self.getTree()
+
+		with self.assertRaises(ValueError):
+			self.generate(description='Another foo', languages='en')
+
+		# Refused before anything is touched
+		self.assertEqual(self.getTree(), tree)
+
+
+if __name__ == '__main__':
+	unittest.main()